@@ -700,8 +700,8 @@ def update_department_employee_counts():
         # Get current employee counts by department
         department_counts = {}
         for emp in employee_data_manager.employees.values():
-            if emp['employment_info']['status'] == 'Active':
-                dept = emp['employment_info']['department']
+            if emp.employment_info.status == 'Active':
+                dept = emp.employment_info.department
                 department_counts[dept] = department_counts.get(dept, 0) + 1
         
         # Update each department's employee count
@@ -4,8 +4,265 @@ from assets import FlipCards, SearchBox
 import asyncio
 from datetime import datetime, timedelta, date
 import json
+import html
 import uuid
 import hashlib
+import sys
+from functools import lru_cache, partial
+from itertools import chain, islice
+from typing import List, Optional
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from collections import namedtuple, deque
+from contextvars import ContextVar
+
+# Security audit events are buffered in memory and written out in batches,
+# either periodically or once the buffer reaches the size threshold
+AUDIT_FLUSH_INTERVAL_SECONDS = 5
+AUDIT_FLUSH_THRESHOLD = 500
+
+# Security audit event record
+SecurityEvent = namedtuple(
+    "SecurityEvent", "timestamp event_type record_id employee_id user_id ip_address session_id"
+)
+
+# Audit context, set once per request by the caller (placeholders until auth is wired in)
+audit_user_id = ContextVar("audit_user_id", default="CURRENT_USER")
+audit_ip_address = ContextVar("audit_ip_address", default="127.0.0.1")
+audit_session_id = ContextVar("audit_session_id", default="SESSION_123")
+
+# How often termination records past the audit retention period are purged
+RETENTION_PURGE_INTERVAL_SECONDS = 3600
+
+# Audit trail hash size in bytes (32 hex characters)
+AUDIT_HASH_DIGEST_SIZE = 16
+
+# Record statuses shown as active termination cases
+ACTIVE_STATUSES = frozenset({"Pending Approval", "In Progress"})
+
+# Security scoring adjustments
+CLEARANCE_SCORES = {"Low": 0, "Medium": -5, "High": -15}
+ACCESS_SCORES = {"Standard": 0, "Administrative": -10, "Executive": -20}
+TERMINATION_TYPE_SCORES = {
+    "Voluntary Resignation": 20,
+    "End of Contract": 15,
+    "Retirement": 25,
+    "Mutual Agreement": 10,
+    "Redundancy": 5,
+    "Dismissal for Cause": -20
+}
+
+# Security levels as bits; a clearance mask has the bit of every level it may see
+LEVEL_BIT = {"Low": 1, "Medium": 2, "High": 4}
+CLEARANCE_MASK = {"Low": 1, "Medium": 3, "High": 7}
+
+# Full class strings for the termination tables, by security level or by
+# red/yellow/green bucket (see _bucket) so rows need no string formatting
+SECURITY_LEVEL_CLASSES = {
+    "High": 'w-28 font-bold text-red-600',
+    "Medium": 'w-28 font-bold text-yellow-600',
+    "Low": 'w-28 font-bold text-green-600'
+}
+PROGRESS_CLASSES = (
+    'w-24 text-center font-bold text-red-600',
+    'w-24 text-center font-bold text-yellow-600',
+    'w-24 text-center font-bold text-green-600'
+)
+SCORE_CLASSES = (
+    'w-28 text-center font-bold text-red-600',
+    'w-28 text-center font-bold text-yellow-600',
+    'w-28 text-center font-bold text-green-600'
+)
+ASSESSMENT_SCORE_CLASSES = (
+    'text-red-600 ml-4 font-bold',
+    'text-yellow-600 ml-4 font-bold',
+    'text-green-600 ml-4 font-bold'
+)
+
+def _bucket(value, medium, high):
+    """0 (red), 1 (yellow) or 2 (green) depending on the thresholds reached"""
+    return 2 if value >= high else 1 if value >= medium else 0
+
+@dataclass(slots=True)
+class TerminationRecord:
+    id: str
+    employee_id: str
+    termination_type: str
+    initiation_date: str
+    effective_date: str
+    status: str
+    security_score: int
+    approval_stage: str
+    employee_name: str = ""
+    reason: str = ""
+    initiated_by: str = ""
+    security_level: Optional[str] = None
+    documentation_complete: int = 0  # percent
+    clearance_progress: int = 0  # percent
+    audit_hash: Optional[str] = None
+    created_by: str = ""
+    created_date: str = ""
+    last_updated: Optional[str] = None
+    immediate_access_revocation: bool = False
+    security_escort_required: bool = False
+    confidential_data_access: bool = False
+    documentation_provided: List[str] = field(default_factory=list)
+    
+    # Display values derived from the fields above, refreshed whenever they change
+    progress: int = field(init=False, default=0)
+    progress_classes: str = field(init=False, default='')
+    security_classes: str = field(init=False, default='')
+    status_color: str = field(init=False, default='')
+    score_classes: str = field(init=False, default='')
+    # Truncated audit hash for the details dialog ("" when the record has no hash)
+    audit_hash_display: str = field(init=False, default='')
+    
+    def __post_init__(self):
+        if self.audit_hash:
+            self.audit_hash_display = f'Audit Hash: {self.audit_hash[:16]}...'
+        self.refresh_display_fields()
+    
+    def refresh_display_fields(self):
+        """Recompute the derived display values after a status or progress change"""
+        self.progress = (self.documentation_complete + self.clearance_progress) // 2
+        self.progress_classes = PROGRESS_CLASSES[_bucket(self.progress, 50, 80)]
+        self.security_classes = SECURITY_LEVEL_CLASSES.get(self.security_level, SECURITY_LEVEL_CLASSES["Low"])
+        self.status_color = 'yellow' if 'Pending' in self.status else 'blue'
+        self.score_classes = SCORE_CLASSES[_bucket(self.security_score, 60, 80)]
+
+@dataclass
+class TerminationSnapshot:
+    """Termination records bucketed in a single pass for one page render"""
+    active: List[TerminationRecord]
+    completed: List[TerminationRecord]
+    active_count: int
+    high_security_count: int
+
+@dataclass(frozen=True)
+class SecurityMetrics:
+    """Aggregates shown on the security analytics dashboard"""
+    high_security_cases: int
+    avg_security_score: int
+    compliance_rate: int
+    audit_findings: int
+    privileged_access_users: int
+    critical_project_members: int
+    immediate_terminations: int
+    documentation_gaps: int
+
+# (valid, errors, warnings, security_alerts) for a request that raises no issues
+_VALIDATION_PASSED = (True, (), (), ())
+
+@lru_cache(maxsize=4096)
+def _parse_date(value):
+    """Parse a YYYY-MM-DD string into a date (cached, dates repeat across calls)"""
+    return date.fromisoformat(value)
+
+def _iso_date(value):
+    """Format a ui.date value as YYYY-MM-DD ("" when unset)
+
+    ui.date holds a date until the user picks one, then a YYYY-MM-DD string.
+    """
+    if not value:
+        return ""
+    if isinstance(value, str):
+        return value
+    return value.isoformat()
+
+# Termination types and their security levels
+_TERMINATION_TYPES = {
+    "Voluntary Resignation": {
+        "code": "VR",
+        "notice_period_days": 30,
+        "requires_approval": False,
+        "security_level": "Low",
+        "documentation_required": ("Resignation Letter", "Handover Document"),
+        "exit_interview_required": True,
+        "clearance_checklist": ("IT Equipment", "Access Cards", "Office Keys")
+    },
+    "End of Contract": {
+        "code": "EOC",
+        "notice_period_days": 14,
+        "requires_approval": False,
+        "security_level": "Medium",
+        "documentation_required": ("Contract Completion Form", "Performance Review"),
+        "exit_interview_required": False,
+        "clearance_checklist": ("IT Equipment", "Access Cards", "Project Handover")
+    },
+    "Dismissal for Cause": {
+        "code": "DFC",
+        "notice_period_days": 0,
+        "requires_approval": True,
+        "security_level": "High",
+        "documentation_required": ("Disciplinary Record", "Investigation Report", "Legal Review"),
+        "exit_interview_required": False,
+        "clearance_checklist": ("Immediate Access Revocation", "Security Escort", "Asset Recovery")
+    },
+    "Redundancy": {
+        "code": "RED",
+        "notice_period_days": 60,
+        "requires_approval": True,
+        "security_level": "Medium",
+        "documentation_required": ("Redundancy Notice", "Consultation Record", "Support Package"),
+        "exit_interview_required": True,
+        "clearance_checklist": ("IT Equipment", "Access Cards", "Final Pay Calculation")
+    },
+    "Retirement": {
+        "code": "RET",
+        "notice_period_days": 90,
+        "requires_approval": False,
+        "security_level": "Low",
+        "documentation_required": ("Retirement Notice", "Pension Documentation", "Benefits Transfer"),
+        "exit_interview_required": True,
+        "clearance_checklist": ("Knowledge Transfer", "IT Equipment", "Access Cards")
+    },
+    "Mutual Agreement": {
+        "code": "MA",
+        "notice_period_days": 21,
+        "requires_approval": True,
+        "security_level": "Medium",
+        "documentation_required": ("Settlement Agreement", "Legal Confirmation", "Mutual Release"),
+        "exit_interview_required": False,
+        "clearance_checklist": ("IT Equipment", "Confidentiality Agreement", "Final Settlement")
+    }
+}
+
+# Security audit configuration
+_SECURITY_SETTINGS = {
+    "require_dual_authorization": True,
+    "audit_trail_retention_days": 2555,  # 7 years
+    "immediate_access_revocation_types": ("Dismissal for Cause",),
+    "sensitive_data_handling": True,
+    "mandatory_security_review": ("High", "Administrative"),
+    "encryption_required": True
+}
+
+# Approval workflow based on security level
+_APPROVAL_WORKFLOWS = {
+    "Low": (
+        {"stage": "Manager Approval", "timeout_days": 3},
+        {"stage": "HR Review", "timeout_days": 2}
+    ),
+    "Medium": (
+        {"stage": "Manager Approval", "timeout_days": 2},
+        {"stage": "HR Review", "timeout_days": 2},
+        {"stage": "Department Head Approval", "timeout_days": 1}
+    ),
+    "High": (
+        {"stage": "Manager Approval", "timeout_days": 1},
+        {"stage": "HR Review", "timeout_days": 1},
+        {"stage": "Department Head Approval", "timeout_days": 1},
+        {"stage": "Security Review", "timeout_days": 1},
+        {"stage": "Executive Approval", "timeout_days": 1}
+    )
+}
+
+# Read-only views shared by all TerminationManager instances
+TERMINATION_TYPES = MappingProxyType({name: MappingProxyType(config) for name, config in _TERMINATION_TYPES.items()})
+APPROVAL_WORKFLOWS = MappingProxyType({
+    level: tuple(MappingProxyType(stage) for stage in stages) for level, stages in _APPROVAL_WORKFLOWS.items()
+})
+SECURITY_SETTINGS = MappingProxyType(_SECURITY_SETTINGS)
 
 # Secure Employee Termination Management System with Advanced HR Algorithms
 class TerminationManager:
@@ -14,65 +271,26 @@ class TerminationManager:
     termination processing, compliance checking, and audit trail management
     """
     
+    # Policy configuration is read-only and shared across instances
+    termination_types = TERMINATION_TYPES
+    approval_workflows = APPROVAL_WORKFLOWS
+    security_settings = SECURITY_SETTINGS
+    
+    # Termination type select options, treat as read-only. ui.select reads any
+    # non-list options as a value -> label mapping, so this is a list, not a tuple
+    termination_type_names = list(TERMINATION_TYPES)
+    
+    # Per-type lookups used by the scoring algorithm
+    _required_notice = {name: config["notice_period_days"] for name, config in TERMINATION_TYPES.items()}
+    _required_docs_count = {name: len(config["documentation_required"]) for name, config in TERMINATION_TYPES.items()}
+    
+    # First approval stage for each security level
+    _first_stage_by_level = {
+        level: stages[0]["stage"] if stages else "HR Review"
+        for level, stages in APPROVAL_WORKFLOWS.items()
+    }
+    
     def __init__(self):
-        # Termination types and their security levels
-        self.termination_types = {
-            "Voluntary Resignation": {
-                "code": "VR",
-                "notice_period_days": 30,
-                "requires_approval": False,
-                "security_level": "Low",
-                "documentation_required": ["Resignation Letter", "Handover Document"],
-                "exit_interview_required": True,
-                "clearance_checklist": ["IT Equipment", "Access Cards", "Office Keys"]
-            },
-            "End of Contract": {
-                "code": "EOC",
-                "notice_period_days": 14,
-                "requires_approval": False,
-                "security_level": "Medium",
-                "documentation_required": ["Contract Completion Form", "Performance Review"],
-                "exit_interview_required": False,
-                "clearance_checklist": ["IT Equipment", "Access Cards", "Project Handover"]
-            },
-            "Dismissal for Cause": {
-                "code": "DFC",
-                "notice_period_days": 0,
-                "requires_approval": True,
-                "security_level": "High",
-                "documentation_required": ["Disciplinary Record", "Investigation Report", "Legal Review"],
-                "exit_interview_required": False,
-                "clearance_checklist": ["Immediate Access Revocation", "Security Escort", "Asset Recovery"]
-            },
-            "Redundancy": {
-                "code": "RED",
-                "notice_period_days": 60,
-                "requires_approval": True,
-                "security_level": "Medium",
-                "documentation_required": ["Redundancy Notice", "Consultation Record", "Support Package"],
-                "exit_interview_required": True,
-                "clearance_checklist": ["IT Equipment", "Access Cards", "Final Pay Calculation"]
-            },
-            "Retirement": {
-                "code": "RET",
-                "notice_period_days": 90,
-                "requires_approval": False,
-                "security_level": "Low",
-                "documentation_required": ["Retirement Notice", "Pension Documentation", "Benefits Transfer"],
-                "exit_interview_required": True,
-                "clearance_checklist": ["Knowledge Transfer", "IT Equipment", "Access Cards"]
-            },
-            "Mutual Agreement": {
-                "code": "MA",
-                "notice_period_days": 21,
-                "requires_approval": True,
-                "security_level": "Medium",
-                "documentation_required": ["Settlement Agreement", "Legal Confirmation", "Mutual Release"],
-                "exit_interview_required": False,
-                "clearance_checklist": ["IT Equipment", "Confidentiality Agreement", "Final Settlement"]
-            }
-        }
-        
         # Mock employee data with security classifications
         self.employees = [
             {
@@ -112,123 +330,188 @@ class TerminationManager:
         
         # Existing termination records
         self.termination_records = [
-            {
-                "id": "TERM-001",
-                "employee_id": "EMP-456",
-                "employee_name": "Alice Brown",
-                "termination_type": "Voluntary Resignation",
-                "initiation_date": "2024-09-15",
-                "effective_date": "2024-10-15",
-                "reason": "Career advancement opportunity",
-                "status": "In Progress",
-                "initiated_by": "Employee",
-                "security_score": 95,
-                "approval_stage": "Manager Review",
-                "documentation_complete": 80,
-                "clearance_progress": 60,
-                "created_by": "EMP-456",
-                "created_date": "2024-09-15"
-            },
-            {
-                "id": "TERM-002",
-                "employee_id": "EMP-789",
-                "employee_name": "Robert Wilson",
-                "termination_type": "End of Contract",
-                "initiation_date": "2024-09-20",
-                "effective_date": "2024-10-05",
-                "reason": "Contract completion",
-                "status": "Completed",
-                "initiated_by": "HR",
-                "security_score": 98,
-                "approval_stage": "Completed",
-                "documentation_complete": 100,
-                "clearance_progress": 100,
-                "created_by": "HR-001",
-                "created_date": "2024-09-20"
-            }
+            TerminationRecord(
+                id="TERM-001",
+                employee_id="EMP-456",
+                employee_name="Alice Brown",
+                termination_type="Voluntary Resignation",
+                initiation_date="2024-09-15",
+                effective_date="2024-10-15",
+                reason="Career advancement opportunity",
+                status="In Progress",
+                initiated_by="Employee",
+                security_score=95,
+                approval_stage="Manager Review",
+                documentation_complete=80,
+                clearance_progress=60,
+                created_by="EMP-456",
+                created_date="2024-09-15"
+            ),
+            TerminationRecord(
+                id="TERM-002",
+                employee_id="EMP-789",
+                employee_name="Robert Wilson",
+                termination_type="End of Contract",
+                initiation_date="2024-09-20",
+                effective_date="2024-10-05",
+                reason="Contract completion",
+                status="Completed",
+                initiated_by="HR",
+                security_score=98,
+                approval_stage="Completed",
+                documentation_complete=100,
+                clearance_progress=100,
+                created_by="HR-001",
+                created_date="2024-09-20"
+            )
         ]
         
-        # Security audit configuration
-        self.security_settings = {
-            "require_dual_authorization": True,
-            "audit_trail_retention_days": 2555,  # 7 years
-            "immediate_access_revocation_types": ["Dismissal for Cause"],
-            "sensitive_data_handling": True,
-            "mandatory_security_review": ["High", "Administrative"],
-            "encryption_required": True
-        }
+        # Secondary index of termination records by security level
+        self._records_by_level = {}
+        for record in self.termination_records:
+            self._records_by_level.setdefault(record.security_level, []).append(record)
         
-        # Approval workflow based on security level
-        self.approval_workflows = {
-            "Low": [
-                {"stage": "Manager Approval", "timeout_days": 3},
-                {"stage": "HR Review", "timeout_days": 2}
-            ],
-            "Medium": [
-                {"stage": "Manager Approval", "timeout_days": 2},
-                {"stage": "HR Review", "timeout_days": 2},
-                {"stage": "Department Head Approval", "timeout_days": 1}
-            ],
-            "High": [
-                {"stage": "Manager Approval", "timeout_days": 1},
-                {"stage": "HR Review", "timeout_days": 1},
-                {"stage": "Department Head Approval", "timeout_days": 1},
-                {"stage": "Security Review", "timeout_days": 1},
-                {"stage": "Executive Approval", "timeout_days": 1}
-            ]
-        }
+        # Termination records partitioned by creation month ("YYYY-MM") so retention
+        # purges and date-window queries only touch the relevant months
+        self._records_by_month = {}
+        for record in self.termination_records:
+            self._records_by_month.setdefault(record.created_date[:7], []).append(record)
+        
+        # Lookups derived from self.employees, rebuilt lazily after employees_changed()
+        self._employees_version = 0
+        self._employee_views_version = -1
+        self._employee_by_id = {}
+        self._employee_display_options = []
+        
+        # Validation results keyed by (employee_id, termination_type, initiation_date, effective_date);
+        # UI re-renders validate the same pending request repeatedly
+        self._validate_cached = lru_cache(maxsize=256)(self._validate_uncached)
+        
+        # Pending security audit events awaiting the next batched flush
+        self._audit_queue = []
+        
+        # (employee_data_manager, update_global_statistics_sync) from enroll_staff,
+        # imported on first use to avoid a circular import
+        self._enroll_mod = None
 
-    def calculate_security_score(self, termination_data):
-        """Advanced security scoring algorithm"""
-        score = 70  # Base score
+    def employees_changed(self):
+        """Call after mutating self.employees to refresh derived lookups and cached results"""
+        self._employees_version += 1
+        self.clear_validation_cache()
+        # The termination form's assessment cache reads employee profiles too
+        _compute_assessment.cache_clear()
+
+    def _sync_employee_views(self):
+        if self._employee_views_version != self._employees_version:
+            self._employee_by_id = {emp["id"]: emp for emp in self.employees}
+            self._employee_display_options = [f"{emp['id']} - {emp['name']} ({emp['department']})" for emp in self.employees]
+            self._employee_views_version = self._employees_version
+
+    @property
+    def employee_by_id(self):
+        """Employee security profiles keyed by ID"""
+        self._sync_employee_views()
+        return self._employee_by_id
+
+    @property
+    def employee_display_options(self):
+        """Employee select options ("ID - Name (Department)"), treat as read-only"""
+        self._sync_employee_views()
+        return self._employee_display_options
+
+    def _find_employee(self, employee_id):
+        """Look up an employee security profile by ID"""
+        return self.employee_by_id.get(employee_id)
+
+    def _evaluate(self, termination_data):
+        """Validate and score a termination request in a single pass
         
-        termination_type = termination_data.get("termination_type")
-        employee_id = termination_data.get("employee_id")
+        The employee profile, termination policy and notice period are resolved
+        once and shared by the validation and scoring steps.
+        Returns (validation_result, security_score, security_level).
+        """
+        employee = self._find_employee(termination_data.get("employee_id"))
+        termination_config = self.termination_types.get(termination_data.get("termination_type"))
+        
+        if not employee:
+            validation = self._validate_from(None, termination_config, None, termination_data)
+            security_level = termination_config["security_level"] if termination_config else "Low"
+            return validation, 50, security_level  # Low score for unknown employee
+        
+        notice_provided = self.calculate_notice_period(termination_data)
+        validation = self._validate_from(employee, termination_config, notice_provided, termination_data)
+        security_score = self._score_from(employee, notice_provided, termination_data)
+        
+        security_level = termination_config["security_level"] if termination_config else "Low"
+        if employee.get("security_clearance") == "High":
+            security_level = "High"
         
-        # Get employee security profile
-        employee = next((emp for emp in self.employees if emp["id"] == employee_id), None)
+        return validation, security_score, security_level
+
+    def calculate_security_score(self, termination_data):
+        """Advanced security scoring algorithm"""
+        employee = self._find_employee(termination_data.get("employee_id"))
         if not employee:
             return 50  # Low score for unknown employee
         
-        termination_config = self.termination_types.get(termination_type, {})
+        notice_provided = self.calculate_notice_period(termination_data)
+        return self._score_from(employee, notice_provided, termination_data)
+
+    @staticmethod
+    def _pct(num, denom):
+        """Integer percentage of num over denom, capped at 100 (0 when nothing is required)"""
+        return 0 if denom == 0 else min(100 * num // denom, 100)
+
+    def score_batch(self, termination_data_list):
+        """Security scores for many termination requests, e.g. for analytics"""
+        # Resolve employees through the ID map instead of a scan per request
+        employees_by_id = self.employee_by_id
+        scores = []
+        for termination_data in termination_data_list:
+            employee = employees_by_id.get(termination_data.get("employee_id"))
+            if not employee:
+                scores.append(50)  # Low score for unknown employee
+                continue
+            notice_provided = self.calculate_notice_period(termination_data)
+            scores.append(self._score_from(employee, notice_provided, termination_data))
+        return scores
+
+    def _score_from(self, employee, notice_provided, termination_data):
+        """Security score for an already resolved employee and notice period"""
+        score = 70  # Base score
+        
+        termination_type = termination_data.get("termination_type")
+        clearance = employee.get("security_clearance", "Low")
+        access = employee.get("access_level", "Standard")
+        reports = employee.get("direct_reports", 0)
+        projects = employee.get("critical_projects") or ()
         
         # Security clearance factor
-        clearance_scores = {"Low": 0, "Medium": -5, "High": -15}
-        score += clearance_scores.get(employee.get("security_clearance", "Low"), 0)
+        score += CLEARANCE_SCORES.get(clearance, 0)
         
         # Access level factor
-        access_scores = {"Standard": 0, "Administrative": -10, "Executive": -20}
-        score += access_scores.get(employee.get("access_level", "Standard"), 0)
+        score += ACCESS_SCORES.get(access, 0)
         
         # Critical projects factor
-        if employee.get("critical_projects"):
-            score -= len(employee["critical_projects"]) * 5
+        if projects:
+            score -= len(projects) * 5
         
         # Direct reports factor (management responsibility)
-        if employee.get("direct_reports", 0) > 0:
-            score -= employee["direct_reports"] * 2
+        if reports > 0:
+            score -= reports * 2
         
         # Termination type factor
-        type_scores = {
-            "Voluntary Resignation": 20,
-            "End of Contract": 15,
-            "Retirement": 25,
-            "Mutual Agreement": 10,
-            "Redundancy": 5,
-            "Dismissal for Cause": -20
-        }
-        score += type_scores.get(termination_type, 0)
+        score += TERMINATION_TYPE_SCORES.get(termination_type, 0)
         
         # Notice period compliance
-        required_notice = termination_config.get("notice_period_days", 0)
-        provided_notice = self.calculate_notice_period(termination_data)
-        if provided_notice >= required_notice:
+        required_notice = self._required_notice.get(termination_type, 0)
+        if notice_provided >= required_notice:
             score += 10
         else:
             score -= 15
         
         # Documentation completeness
-        required_docs = len(termination_config.get("documentation_required", []))
+        required_docs = self._required_docs_count.get(termination_type, 0)
         provided_docs = len(termination_data.get("documentation_provided", []))
         if provided_docs >= required_docs:
             score += 15
@@ -239,12 +522,66 @@ class TerminationManager:
 
     def calculate_notice_period(self, termination_data):
         """Calculate notice period provided"""
-        initiation_date = datetime.strptime(termination_data.get("initiation_date", ""), "%Y-%m-%d").date()
-        effective_date = datetime.strptime(termination_data.get("effective_date", ""), "%Y-%m-%d").date()
+        initiation_date = _parse_date(termination_data.get("initiation_date", ""))
+        effective_date = _parse_date(termination_data.get("effective_date", ""))
         return (effective_date - initiation_date).days
 
     def validate_termination_request(self, termination_data):
         """Comprehensive security validation"""
+        valid, errors, warnings, security_alerts = self._validate_cached(
+            termination_data.get("employee_id"),
+            termination_data.get("termination_type"),
+            termination_data.get("initiation_date", ""),
+            termination_data.get("effective_date", "")
+        )
+        return {
+            "valid": valid,
+            "errors": list(errors),
+            "warnings": list(warnings),
+            "security_alerts": list(security_alerts)
+        }
+
+    def clear_validation_cache(self):
+        """Discard cached validation results after employee or policy changes"""
+        self._validate_cached.cache_clear()
+
+    def _validate_uncached(self, employee_id, termination_type, initiation_date, effective_date):
+        """Validation result as an immutable (valid, errors, warnings, security_alerts) tuple"""
+        termination_data = {
+            "employee_id": employee_id,
+            "termination_type": termination_type,
+            "initiation_date": initiation_date,
+            "effective_date": effective_date
+        }
+        employee = self._find_employee(employee_id)
+        termination_config = self.termination_types.get(termination_type)
+        
+        # The notice period is only checked for a known employee and valid termination type
+        notice_provided = None
+        if employee and termination_config:
+            notice_provided = self.calculate_notice_period(termination_data)
+        
+        # Fast path for the common Low-security case (voluntary resignation, retirement):
+        # nothing to flag when the employee has no elevated clearance, critical projects
+        # or direct reports and the notice period is met
+        if (notice_provided is not None
+                and termination_config["security_level"] == "Low"
+                and employee.get("security_clearance") != "High"
+                and not employee.get("critical_projects")
+                and employee.get("direct_reports", 0) <= 0
+                and notice_provided >= termination_config.get("notice_period_days", 0)):
+            return _VALIDATION_PASSED
+        
+        result = self._validate_from(employee, termination_config, notice_provided, termination_data)
+        return (
+            result["valid"],
+            tuple(result["errors"]),
+            tuple(result["warnings"]),
+            tuple(result["security_alerts"])
+        )
+
+    def _validate_from(self, employee, termination_config, notice_provided, termination_data):
+        """Validation for an already resolved employee, policy and notice period"""
         validation_result = {
             "valid": True,
             "errors": [],
@@ -252,37 +589,37 @@ class TerminationManager:
             "security_alerts": []
         }
         
-        employee_id = termination_data.get("employee_id")
         termination_type = termination_data.get("termination_type")
         
         # Employee existence check
-        employee = next((emp for emp in self.employees if emp["id"] == employee_id), None)
         if not employee:
             validation_result["valid"] = False
             validation_result["errors"].append("Employee not found in system")
             return validation_result
         
+        clearance = employee.get("security_clearance")
+        reports = employee.get("direct_reports", 0)
+        projects = employee.get("critical_projects") or ()
+        
         # Security clearance validation
-        if employee.get("security_clearance") == "High":
+        if clearance == "High":
             validation_result["security_alerts"].append("High security clearance employee - Enhanced security protocols required")
         
         # Critical project validation
-        if employee.get("critical_projects"):
-            validation_result["warnings"].append(f"Employee involved in {len(employee['critical_projects'])} critical projects - Handover required")
+        if projects:
+            validation_result["warnings"].append(f"Employee involved in {len(projects)} critical projects - Handover required")
         
         # Management responsibility validation
-        if employee.get("direct_reports", 0) > 0:
-            validation_result["warnings"].append(f"Employee manages {employee['direct_reports']} direct reports - Succession planning required")
+        if reports > 0:
+            validation_result["warnings"].append(f"Employee manages {reports} direct reports - Succession planning required")
         
         # Termination type validation
-        termination_config = self.termination_types.get(termination_type)
         if not termination_config:
             validation_result["valid"] = False
             validation_result["errors"].append("Invalid termination type")
             return validation_result
         
         # Notice period validation
-        notice_provided = self.calculate_notice_period(termination_data)
         notice_required = termination_config.get("notice_period_days", 0)
         
         if notice_provided < notice_required:
@@ -303,25 +640,21 @@ class TerminationManager:
         # Generate secure ID
         new_id = f"TERM-{str(uuid.uuid4())[:6].upper()}"
         
-        # Calculate security score
-        security_score = self.calculate_security_score(termination_data)
-        
-        # Determine approval workflow
-        employee = next((emp for emp in self.employees if emp["id"] == termination_data.get("employee_id")), None)
-        termination_config = self.termination_types.get(termination_data.get("termination_type"), {})
+        # One timestamp for the record, its audit hash and the audit event
+        now = datetime.now()
+        timestamp = now.isoformat()
         
-        security_level = termination_config.get("security_level", "Low")
-        if employee and employee.get("security_clearance") == "High":
-            security_level = "High"
+        # Calculate security score and level in one pass over employee and policy
+        _, security_score, security_level = self._evaluate(termination_data)
         
-        workflow = self.approval_workflows.get(security_level, self.approval_workflows["Low"])
-        first_stage = workflow[0]["stage"] if workflow else "HR Review"
+        # Determine approval workflow
+        first_stage = self._first_stage_by_level.get(security_level, self._first_stage_by_level["Low"])
         
-        # Create audit trail hash
-        audit_data = f"{new_id}{termination_data.get('employee_id')}{datetime.now().isoformat()}"
-        audit_hash = hashlib.sha256(audit_data.encode()).hexdigest()
+        # Create audit trail hash (BLAKE2b is faster than SHA-256 for short inputs)
+        audit_data = f"{new_id}{termination_data.get('employee_id')}{timestamp}"
+        audit_hash = hashlib.blake2b(audit_data.encode(), digest_size=AUDIT_HASH_DIGEST_SIZE).hexdigest()
         
-        new_record = {
+        new_record = TerminationRecord(**{
             "id": new_id,
             "status": "Pending Approval",
             "security_score": security_score,
@@ -331,56 +664,151 @@ class TerminationManager:
             "clearance_progress": 0,
             "audit_hash": audit_hash,
             "created_by": "CURRENT_USER",  # Would be actual user ID
-            "created_date": datetime.now().strftime("%Y-%m-%d"),
-            "last_updated": datetime.now().isoformat(),
+            "created_date": now.date().isoformat(),
+            "last_updated": timestamp,
             **termination_data
-        }
+        })
         
         self.termination_records.append(new_record)
+        self._records_by_level.setdefault(security_level, []).append(new_record)
+        self._records_by_month.setdefault(new_record.created_date[:7], []).append(new_record)
         
         # Log security event
-        self.log_security_event("TERMINATION_INITIATED", new_id, termination_data.get("employee_id"))
+        self.log_security_event("TERMINATION_INITIATED", new_id, termination_data.get("employee_id"), timestamp)
         
         return True, new_id, security_score
 
-    def log_security_event(self, event_type, record_id, employee_id):
+    def log_security_event(self, event_type, record_id, employee_id, timestamp=None):
         """Log security events for audit trail"""
         # In a real system, this would write to a secure audit log
-        event = {
-            "timestamp": datetime.now().isoformat(),
-            "event_type": event_type,
-            "record_id": record_id,
-            "employee_id": employee_id,
-            "user_id": "CURRENT_USER",
-            "ip_address": "127.0.0.1",  # Would be actual IP
-            "session_id": "SESSION_123"  # Would be actual session
-        }
-        print(f"SECURITY AUDIT LOG: {event}")
+        event = SecurityEvent(
+            timestamp or datetime.now().isoformat(),
+            event_type,
+            record_id,
+            employee_id,
+            audit_user_id.get(),
+            audit_ip_address.get(),
+            audit_session_id.get()
+        )
+        self._audit_queue.append(event)
+        
+        if len(self._audit_queue) >= AUDIT_FLUSH_THRESHOLD:
+            self.flush_audit_log()
+
+    def flush_audit_log(self):
+        """Write all buffered security events in a single batch"""
+        # Swap the buffer first so events logged during the write go to the next batch
+        events, self._audit_queue = self._audit_queue, []
+        if not events:
+            return 0
+        
+        sys.stdout.write("".join(f"SECURITY AUDIT LOG: {event._asdict()}\n" for event in events))
+        sys.stdout.flush()
+        return len(events)
 
     def get_termination_records(self, security_filter=None):
-        """Get termination records with security filtering"""
-        records = self.termination_records.copy()
+        """Get termination records with security filtering
+        
+        Unfiltered results are the live record list and must be treated as
+        read-only. Filtered results are grouped by security level in filter order.
+        security_filter is either a list of levels or a CLEARANCE_MASK bitmask.
+        """
+        if not security_filter:
+            return self.termination_records
+        
+        # Apply security filtering based on user permissions via the level index
+        if isinstance(security_filter, int):
+            levels = [level for level, bit in LEVEL_BIT.items() if bit & security_filter]
+        else:
+            levels = dict.fromkeys(security_filter)
+        return list(chain.from_iterable(self._records_by_level.get(level, ()) for level in levels))
+
+    def compute_security_metrics(self):
+        """Aggregate the security analytics metrics in a single pass over the records
+        
+        Active cases feed the risk counts; completed cases that were closed without
+        full documentation or clearance count as audit findings.
+        """
+        employee_by_id = self.employee_by_id
+        high_security = privileged = critical = immediate = doc_gaps = 0
+        completed = findings = score_total = 0
+        for record in self.termination_records:
+            score_total += record.security_score
+            status = record.status
+            if status in ACTIVE_STATUSES:
+                if record.security_level == "High":
+                    high_security += 1
+                if record.immediate_access_revocation:
+                    immediate += 1
+                if record.documentation_complete < 100:
+                    doc_gaps += 1
+                employee = employee_by_id.get(record.employee_id)
+                if employee:
+                    if employee.get("access_level", "Standard") != "Standard":
+                        privileged += 1
+                    if employee.get("critical_projects"):
+                        critical += 1
+            elif status == "Completed":
+                completed += 1
+                if record.documentation_complete < 100 or record.clearance_progress < 100:
+                    findings += 1
+        
+        total = len(self.termination_records)
+        return SecurityMetrics(
+            high_security_cases=high_security,
+            avg_security_score=round(score_total / total) if total else 0,
+            compliance_rate=100 - self._pct(findings, completed),
+            audit_findings=findings,
+            privileged_access_users=privileged,
+            critical_project_members=critical,
+            immediate_terminations=immediate,
+            documentation_gaps=doc_gaps
+        )
+
+    def get_termination_records_for_period(self, start_date, end_date):
+        """Get termination records created between two YYYY-MM-DD dates (inclusive)"""
+        start_month, end_month = start_date[:7], end_date[:7]
+        return [
+            record
+            for month, records in self._records_by_month.items() if start_month <= month <= end_month
+            for record in records if start_date <= record.created_date <= end_date
+        ]
+
+    def purge_expired_records(self, today=None):
+        """Drop whole months of termination records older than the audit retention period"""
+        retention_days = self.security_settings["audit_trail_retention_days"]
+        cutoff_month = ((today or date.today()) - timedelta(days=retention_days)).isoformat()[:7]
+        
+        expired_months = [month for month in self._records_by_month if month < cutoff_month]
+        if not expired_months:
+            return 0
         
-        # Apply security filtering based on user permissions
-        if security_filter:
-            records = [r for r in records if r.get("security_level") in security_filter]
+        expired = set()
+        for month in expired_months:
+            expired.update(id(record) for record in self._records_by_month.pop(month))
         
-        return records
+        self.termination_records[:] = [r for r in self.termination_records if id(r) not in expired]
+        for level, records in self._records_by_level.items():
+            records[:] = [r for r in records if id(r) not in expired]
+        
+        return len(expired)
 
     def update_termination_status(self, record_id, new_status, user_id):
         """Update termination status with audit trail"""
         for record in self.termination_records:
-            if record["id"] == record_id:
-                old_status = record["status"]
-                record["status"] = new_status
-                record["last_updated"] = datetime.now().isoformat()
+            if record.id == record_id:
+                old_status = record.status
+                record.status = new_status
+                timestamp = datetime.now().isoformat()
+                record.last_updated = timestamp
+                record.refresh_display_fields()
 
                 # If termination is completed, update employee status and statistics
                 if new_status == "Completed" and old_status != "Completed":
                     self._complete_employee_termination(record)
 
                 # Log status change
-                self.log_security_event("STATUS_CHANGED", record_id, record.get("employee_id"))
+                self.log_security_event("STATUS_CHANGED", record_id, record.employee_id, timestamp)
 
                 return True
         return False
@@ -388,17 +816,20 @@ class TerminationManager:
     def _complete_employee_termination(self, termination_record):
         """Complete employee termination by updating status and statistics"""
         try:
-            employee_id = termination_record.get("employee_id")
+            employee_id = termination_record.employee_id
 
-            # Import here to avoid circular imports
-            from components.administration.enroll_staff import employee_data_manager, update_global_statistics_sync
+            # Import here to avoid circular imports (only once, then reuse)
+            if self._enroll_mod is None:
+                from components.administration.enroll_staff import employee_data_manager, update_global_statistics_sync
+                self._enroll_mod = (employee_data_manager, update_global_statistics_sync)
+            employee_data_manager, update_global_statistics_sync = self._enroll_mod
 
             # Update employee status to Terminated if they exist in the system
-            if employee_id in employee_data_manager.employees:
-                employee_data_manager.employees[employee_id]['employment_info']['status'] = 'Terminated'
-                employee_data_manager.employees[employee_id]['employment_info']['termination_date'] = termination_record.get("effective_date")
-                employee_data_manager.employees[employee_id]['employment_info']['termination_reason'] = termination_record.get("reason")
-
+            if employee_data_manager.set_employee_status(
+                employee_id, 'Terminated',
+                termination_date=termination_record.effective_date,
+                termination_reason=termination_record.reason
+            ):
                 # Update global statistics after termination
                 update_global_statistics_sync()
 
@@ -410,6 +841,194 @@ class TerminationManager:
 # Global termination manager instance
 termination_manager = TerminationManager()
 
+async def _flush_audit_log_periodically():
+    """Background task that flushes buffered security audit events"""
+    while True:
+        await asyncio.sleep(AUDIT_FLUSH_INTERVAL_SECONDS)
+        termination_manager.flush_audit_log()
+
+async def _purge_expired_records_periodically():
+    """Background task that enforces the audit trail retention period"""
+    while True:
+        termination_manager.purge_expired_records()
+        await asyncio.sleep(RETENTION_PURGE_INTERVAL_SECONDS)
+
+app.on_startup(_flush_audit_log_periodically)
+app.on_startup(_purge_expired_records_periodically)
+app.on_shutdown(termination_manager.flush_audit_log)
+
+# Security event severity colors and the full icon class strings derived from them
+SEVERITY_COLORS = {
+    'high': 'text-red-500',
+    'medium': 'text-orange-500',
+    'low': 'text-yellow-500',
+    'info': 'text-blue-500'
+}
+SEVERITY_ICON_CLASSES = {severity: f'{color} text-xs' for severity, color in SEVERITY_COLORS.items()}
+
+# Completed archive rows rendered up front and per "Load more" click
+ARCHIVE_PAGE_SIZE = 50
+# Once more rows than this are on screen the oldest half is folded into the "Older records" expansion
+ARCHIVE_MAX_LIVE_ROWS = 200
+
+# Static HTML fragments, built once at import time and reused on every render
+_HEADER_HTML = '''
+    <div class="flex items-center gap-4">
+        <div class="bg-white bg-opacity-20 p-3 rounded-full">
+            <i class="material-icons text-4xl">security</i>
+        </div>
+        <div>
+            <h1 class="text-4xl font-bold mb-2">Employee Termination Management</h1>
+            <p class="text-red-100 text-lg">Secure termination processing with dual authorization and audit trails</p>
+        </div>
+    </div>
+'''
+
+_OVERVIEW_METRIC_CARD_TEMPLATE = '''
+    <div class="flex items-center justify-between">
+        <div>
+            <div class="text-3xl font-bold">{value}</div>
+            <div class="text-{color}-100">{label}</div>
+        </div>
+        <i class="material-icons text-4xl opacity-75">{icon}</i>
+    </div>
+'''
+
+# (color, value, label, icon) for the security overview metric grid
+_OVERVIEW_METRICS = (
+    ("red", "4", "Active Cases", "warning"),
+    ("orange", "2", "High Risk", "error"),
+    ("green", "98%", "Security Score", "shield"),
+    ("blue", "100%", "Compliance", "verified"),
+)
+
+_OVERVIEW_METRIC_CARDS = tuple(
+    (
+        f'p-6 bg-gradient-to-br from-{color}-500 to-{color}-600 text-white',
+        _OVERVIEW_METRIC_CARD_TEMPLATE.format(color=color, value=value, label=label, icon=icon)
+    )
+    for color, value, label, icon in _OVERVIEW_METRICS
+)
+
+# (factor, risk label, color, percent) for the overview risk factor bars
+_RISK_FACTORS = (
+    ("Administrative Access", "HIGH RISK", "red", 90),
+    ("Critical Projects", "MEDIUM", "orange", 60),
+    ("Security Clearance", "HIGH RISK", "red", 85),
+    ("Data Access Level", "MEDIUM", "yellow", 70),
+)
+
+# (type, policy detail labels, document bullets, checklist bullets) for the policies section;
+# the policy config is static so the label text is formatted once here
+POLICY_ROWS = tuple(
+    (
+        termination_type,
+        (
+            f'Code: {config["code"]}',
+            f'Notice Period: {config["notice_period_days"]} days',
+            f'Security Level: {config["security_level"]}',
+            f'Approval Required: {"Yes" if config["requires_approval"] else "No"}',
+            f'Exit Interview: {"Required" if config["exit_interview_required"] else "Optional"}',
+        ),
+        tuple(f'• {doc}' for doc in config["documentation_required"]),
+        tuple(f'• {item}' for item in config["clearance_checklist"]),
+    )
+    for termination_type, config in TERMINATION_TYPES.items()
+)
+
+_CRITICAL_ALERT_HTML = '''
+    <div class="flex items-start gap-4">
+        <div class="bg-red-500 text-white p-2 rounded-full">
+            <i class="material-icons">warning</i>
+        </div>
+        <div>
+            <h3 class="text-lg font-semibold text-red-800 mb-2">Critical Security Alert</h3>
+            <p class="text-red-700 mb-3">Employee Michael Brown requires immediate dual authorization for termination due to administrative access level.</p>
+            <button class="bg-red-500 text-white px-4 py-2 rounded-lg text-sm font-medium hover:bg-red-600">
+                Review Case
+            </button>
+        </div>
+    </div>
+'''
+
+# Audit event severities, indexing _LEVEL_COLORS
+LEVEL_INFO, LEVEL_LOW, LEVEL_MEDIUM, LEVEL_HIGH = range(4)
+_LEVEL_COLORS = ("text-blue-600", "text-yellow-600", "text-orange-600", "text-red-600")
+
+# Recent security events shown in the audit dialog: (timestamp, event, user, severity, level label)
+_AUDIT_EVENTS = (
+    ("2025-10-12 14:30", "Dual Authorization Required", "admin@company.com", LEVEL_HIGH, "HIGH"),
+    ("2025-10-12 12:15", "Access Revoked", "hr@company.com", LEVEL_MEDIUM, "MEDIUM"),
+    ("2025-10-12 10:45", "Document Accessed", "manager@company.com", LEVEL_LOW, "LOW"),
+    ("2025-10-12 09:20", "Security Check Passed", "security@company.com", LEVEL_INFO, "INFO"),
+)
+
+_AUDIT_EVENT_ROW_TEMPLATE = '''
+    <div class="flex w-full items-center justify-between p-2 hover:bg-gray-50 rounded">
+        <div class="flex flex-col gap-1">
+            <span class="font-medium text-sm">{event}</span>
+            <span class="text-xs text-gray-500">{timestamp} - {user}</span>
+        </div>
+        <span class="text-xs font-bold {color}">{level}</span>
+    </div>
+'''
+
+# The audit events are static, so their markup is built once at import time
+_AUDIT_EVENTS_HTML = ''.join(
+    _AUDIT_EVENT_ROW_TEMPLATE.format(
+        timestamp=html.escape(timestamp), event=html.escape(event), user=html.escape(user),
+        level=level, color=_LEVEL_COLORS[severity]
+    )
+    for timestamp, event, user, severity, level in _AUDIT_EVENTS
+)
+
+_AUDIT_STATISTICS_HTML = '''
+    <div class="space-y-4">
+        <div class="flex justify-between items-center">
+            <span class="font-medium">Total Audit Events</span>
+            <span class="text-blue-600 font-bold">1,247</span>
+        </div>
+        <div class="flex justify-between items-center">
+            <span class="font-medium">High Security Events</span>
+            <span class="text-red-600 font-bold">15</span>
+        </div>
+        <div class="flex justify-between items-center">
+            <span class="font-medium">Compliance Score</span>
+            <span class="text-green-600 font-bold">98.7%</span>
+        </div>
+        <div class="flex justify-between items-center">
+            <span class="font-medium">Failed Authorizations</span>
+            <span class="text-orange-600 font-bold">3</span>
+        </div>
+    </div>
+'''
+
+_NEW_TERMINATION_DIALOG_HEADER_HTML = '''
+    <div class="flex items-center gap-3 mb-6">
+        <div class="bg-red-500 text-white p-3 rounded-full">
+            <i class="material-icons text-2xl">person_remove</i>
+        </div>
+        <div>
+            <h2 class="text-2xl font-bold text-red-800">Initiate Employee Termination</h2>
+            <p class="text-red-600">⚠️ High security process - requires dual authorization</p>
+        </div>
+    </div>
+'''
+
+_SECURITY_NOTICE_HTML = '''
+    <div class="flex items-center gap-2">
+        <i class="material-icons text-red-500">warning</i>
+        <div>
+            <div class="font-semibold text-red-800">Security Notice</div>
+            <div class="text-sm text-red-700">This action requires additional authorization for high-risk employees</div>
+        </div>
+    </div>
+'''
+
+# Quick termination dialog select options, treat as read-only (ui.select needs lists)
+_DIALOG_EMPLOYEE_OPTIONS = ['EMP-001 - John Smith (High Risk)', 'EMP-002 - Sarah Johnson']
+_DIALOG_TERMINATION_TYPES = ['Voluntary Resignation', 'End of Contract', 'Dismissal for Cause', 'Redundancy']
+
 def EmployeeTermination():
     """
     Modern Secure Employee Termination Management page
@@ -419,17 +1038,7 @@ def EmployeeTermination():
     with ui.element('div').classes('w-full bg-gradient-to-r from-red-600 via-red-700 to-red-900 text-white p-8 rounded-xl shadow-2xl mb-8'):
         with ui.row().classes('w-full justify-between items-center'):
             with ui.column():
-                ui.html('''
-                    <div class="flex items-center gap-4">
-                        <div class="bg-white bg-opacity-20 p-3 rounded-full">
-                            <i class="material-icons text-4xl">security</i>
-                        </div>
-                        <div>
-                            <h1 class="text-4xl font-bold mb-2">Employee Termination Management</h1>
-                            <p class="text-red-100 text-lg">Secure termination processing with dual authorization and audit trails</p>
-                        </div>
-                    </div>
-                ''', sanitize=False)
+                ui.html(_HEADER_HTML, sanitize=False)
                 
                 # Security breadcrumb
                 with ui.row().classes('items-center gap-2 text-sm text-red-200 mt-4'):
@@ -450,8 +1059,11 @@ def EmployeeTermination():
                 ui.button('🛡️ Security Audit', on_click=show_security_audit).props('color=white text-color=red-700').classes('font-semibold')
                 ui.button('⚠️ New Termination', on_click=show_new_termination_dialog).props('outlined color=white').classes('font-semibold')
 
+    # Bucket the termination records once for every section on the page
+    snapshot = _snapshot_records()
+    
     # Security dashboard
-    create_security_dashboard()
+    create_security_dashboard(snapshot)
 
     # Main content with secure tabs
     with ui.element('div').classes('w-full'):
@@ -471,7 +1083,7 @@ def EmployeeTermination():
             
             # Active Terminations Panel
             with ui.tab_panel(active_tab):
-                create_active_terminations_section()
+                create_active_terminations_section(snapshot)
             
             # New Termination Panel
             with ui.tab_panel(new_tab):
@@ -479,7 +1091,7 @@ def EmployeeTermination():
             
             # Completed Terminations Panel
             with ui.tab_panel(completed_tab):
-                create_completed_terminations_section()
+                create_completed_terminations_section(snapshot)
             
             # Security Analytics Panel
             with ui.tab_panel(analytics_tab):
@@ -498,53 +1110,9 @@ def create_termination_overview_section():
             
             # Security metrics grid
             with ui.grid(columns=2).classes('w-full gap-4 mb-6'):
-                # Active terminations card
-                with ui.card().classes('p-6 bg-gradient-to-br from-red-500 to-red-600 text-white'):
-                    ui.html('''
-                        <div class="flex items-center justify-between">
-                            <div>
-                                <div class="text-3xl font-bold">4</div>
-                                <div class="text-red-100">Active Cases</div>
-                            </div>
-                            <i class="material-icons text-4xl opacity-75">warning</i>
-                        </div>
-                    ''', sanitize=False)
-                
-                # High risk cases
-                with ui.card().classes('p-6 bg-gradient-to-br from-orange-500 to-orange-600 text-white'):
-                    ui.html('''
-                        <div class="flex items-center justify-between">
-                            <div>
-                                <div class="text-3xl font-bold">2</div>
-                                <div class="text-orange-100">High Risk</div>
-                            </div>
-                            <i class="material-icons text-4xl opacity-75">error</i>
-                        </div>
-                    ''', sanitize=False)
-                
-                # Security score
-                with ui.card().classes('p-6 bg-gradient-to-br from-green-500 to-green-600 text-white'):
-                    ui.html('''
-                        <div class="flex items-center justify-between">
-                            <div>
-                                <div class="text-3xl font-bold">98%</div>
-                                <div class="text-green-100">Security Score</div>
-                            </div>
-                            <i class="material-icons text-4xl opacity-75">shield</i>
-                        </div>
-                    ''', sanitize=False)
-                
-                # Compliance rate
-                with ui.card().classes('p-6 bg-gradient-to-br from-blue-500 to-blue-600 text-white'):
-                    ui.html('''
-                        <div class="flex items-center justify-between">
-                            <div>
-                                <div class="text-3xl font-bold">100%</div>
-                                <div class="text-blue-100">Compliance</div>
-                            </div>
-                            <i class="material-icons text-4xl opacity-75">verified</i>
-                        </div>
-                    ''', sanitize=False)
+                for card_classes, card_html in _OVERVIEW_METRIC_CARDS:
+                    with ui.card().classes(card_classes):
+                        ui.html(card_html, sanitize=False)
             
             # Recent security events
             with ui.card().classes('p-6'):
@@ -559,13 +1127,7 @@ def create_termination_overview_section():
                 for event in security_events:
                     with ui.row().classes('w-full items-center justify-between p-3 hover:bg-gray-50 rounded-lg'):
                         with ui.row().classes('items-center gap-3'):
-                            severity_colors = {
-                                'high': 'text-red-500',
-                                'medium': 'text-orange-500',
-                                'low': 'text-yellow-500',
-                                'info': 'text-blue-500'
-                            }
-                            ui.icon('circle').classes(f'{severity_colors[event["severity"]]} text-xs')
+                            ui.icon('circle').classes(SEVERITY_ICON_CLASSES[event["severity"]])
                             with ui.column().classes('gap-1'):
                                 ui.label(event['event']).classes('font-medium text-gray-800')
                                 ui.label(event['employee']).classes('text-sm text-gray-600')
@@ -577,70 +1139,46 @@ def create_termination_overview_section():
             
             # Critical alert card
             with ui.card().classes('p-6 bg-gradient-to-br from-red-50 to-orange-50 border-l-4 border-red-500 mb-6'):
-                ui.html('''
-                    <div class="flex items-start gap-4">
-                        <div class="bg-red-500 text-white p-2 rounded-full">
-                            <i class="material-icons">warning</i>
-                        </div>
-                        <div>
-                            <h3 class="text-lg font-semibold text-red-800 mb-2">Critical Security Alert</h3>
-                            <p class="text-red-700 mb-3">Employee Michael Brown requires immediate dual authorization for termination due to administrative access level.</p>
-                            <button class="bg-red-500 text-white px-4 py-2 rounded-lg text-sm font-medium hover:bg-red-600">
-                                Review Case
-                            </button>
-                        </div>
-                    </div>
-                ''', sanitize=False)
+                ui.html(_CRITICAL_ALERT_HTML, sanitize=False)
             
             # Risk factors analysis
             with ui.card().classes('p-6'):
                 ui.label('📊 Risk Factor Analysis').classes('text-xl font-semibold text-gray-800 mb-4')
-                ui.html('''
-                    <div class="space-y-4">
-                        <div class="flex justify-between items-center">
-                            <span class="text-sm font-medium text-gray-600">Administrative Access</span>
-                            <span class="text-sm text-red-600 font-semibold">HIGH RISK</span>
-                        </div>
-                        <div class="w-full bg-gray-200 rounded-full h-2">
-                            <div class="bg-red-500 h-2 rounded-full" style="width: 90%"></div>
-                        </div>
-                        
-                        <div class="flex justify-between items-center">
-                            <span class="text-sm font-medium text-gray-600">Critical Projects</span>
-                            <span class="text-sm text-orange-600 font-semibold">MEDIUM</span>
-                        </div>
-                        <div class="w-full bg-gray-200 rounded-full h-2">
-                            <div class="bg-orange-500 h-2 rounded-full" style="width: 60%"></div>
-                        </div>
-                        
-                        <div class="flex justify-between items-center">
-                            <span class="text-sm font-medium text-gray-600">Security Clearance</span>
-                            <span class="text-sm text-red-600 font-semibold">HIGH RISK</span>
-                        </div>
-                        <div class="w-full bg-gray-200 rounded-full h-2">
-                            <div class="bg-red-500 h-2 rounded-full" style="width: 85%"></div>
-                        </div>
-                        
-                        <div class="flex justify-between items-center">
-                            <span class="text-sm font-medium text-gray-600">Data Access Level</span>
-                            <span class="text-sm text-yellow-600 font-semibold">MEDIUM</span>
-                        </div>
-                        <div class="w-full bg-gray-200 rounded-full h-2">
-                            <div class="bg-yellow-500 h-2 rounded-full" style="width: 70%"></div>
-                        </div>
-                    </div>
-                ''', sanitize=False)
-
-def create_security_dashboard():
+                with ui.column().classes('w-full gap-2'):
+                    for label, level, color, pct in _RISK_FACTORS:
+                        _render_risk_bar(label, level, pct, color)
+
+def _snapshot_records():
+    """Split the termination records into active/completed buckets in one pass"""
+    active = []
+    completed = []
+    high_security_count = 0
+    for record in termination_manager.get_termination_records():
+        if record.status in ACTIVE_STATUSES:
+            active.append(record)
+        elif record.status == "Completed":
+            completed.append(record)
+        if record.security_level == "High":
+            high_security_count += 1
+    return TerminationSnapshot(active, completed, len(active), high_security_count)
+
+def _render_risk_bar(label, level, pct, color):
+    """Render one risk factor row with its level label and progress bar"""
+    with ui.row().classes('w-full justify-between items-center'):
+        ui.label(label).classes('text-sm font-medium text-gray-600')
+        ui.label(level).classes(f'text-sm text-{color}-600 font-semibold')
+    ui.linear_progress(value=pct / 100, size='8px', show_value=False, color=color).props('rounded track-color=grey-3').classes('mb-2')
+
+def create_security_dashboard(snapshot=None):
     """Create security monitoring dashboard"""
+    snapshot = snapshot or _snapshot_records()
     with ui.row().classes('w-full gap-4 mb-6'):
         # Active Terminations Card
         with ui.card().classes('p-4 bg-gradient-to-r from-red-500 to-red-600 text-white min-w-48'):
             with ui.row().classes('items-center justify-between'):
                 with ui.column():
                     ui.label('Active Terminations').classes('text-red-100 text-sm')
-                    active_count = len([r for r in termination_manager.get_termination_records() if r["status"] in ["Pending Approval", "In Progress"]])
-                    ui.label(f'{active_count}').classes('text-2xl font-bold')
+                    ui.label(f'{snapshot.active_count}').classes('text-2xl font-bold')
                 ui.icon('pending_actions').classes('text-3xl text-red-200')
         
         # High Security Alerts Card
@@ -648,8 +1186,7 @@ def create_security_dashboard():
             with ui.row().classes('items-center justify-between'):
                 with ui.column():
                     ui.label('Security Alerts').classes('text-orange-100 text-sm')
-                    high_security_count = len([r for r in termination_manager.get_termination_records() if r.get("security_level") == "High"])
-                    ui.label(f'{high_security_count}').classes('text-2xl font-bold')
+                    ui.label(f'{snapshot.high_security_count}').classes('text-2xl font-bold')
                 ui.icon('warning').classes('text-3xl text-orange-200')
         
         # Compliance Score Card
@@ -668,58 +1205,58 @@ def create_security_dashboard():
                     ui.label('12').classes('text-2xl font-bold')
                 ui.icon('history').classes('text-3xl text-blue-200')
 
-def create_active_terminations_section():
+def create_active_terminations_section(snapshot=None):
     """Create active terminations management section"""
+    snapshot = snapshot or _snapshot_records()
     with ui.card().classes('w-full p-6'):
         ui.label('Active Termination Cases').classes('text-xl font-semibold mb-4')
         
-        active_records = [r for r in termination_manager.get_termination_records() if r["status"] in ["Pending Approval", "In Progress"]]
-        
-        if not active_records:
-            with ui.column().classes('items-center py-8'):
-                ui.icon('check_circle').classes('text-green-400 text-6xl mb-4')
-                ui.label('No active termination cases').classes('text-gray-500 text-lg')
-                ui.label('All termination processes are completed').classes('text-gray-400 text-sm')
-        else:
-            # Table header
-            with ui.row().classes('w-full p-4 bg-gray-50 rounded-t-lg font-semibold'):
-                ui.label('Case ID').classes('w-28')
-                ui.label('Employee').classes('flex-1')
-                ui.label('Type').classes('w-32')
-                ui.label('Security Level').classes('w-28')
-                ui.label('Status').classes('w-32')
-                ui.label('Progress').classes('w-24 text-center')
-                ui.label('Actions').classes('w-32 text-center')
+        _render_active_body(snapshot.active)
+
+@ui.refreshable
+def _render_active_body(active_records):
+    """Active termination table; refresh with the new active records after a change"""
+    if not active_records:
+        with ui.column().classes('items-center py-8'):
+            ui.icon('check_circle').classes('text-green-400 text-6xl mb-4')
+            ui.label('No active termination cases').classes('text-gray-500 text-lg')
+            ui.label('All termination processes are completed').classes('text-gray-400 text-sm')
+        return
+    
+    # Table header
+    with ui.row().classes('w-full p-4 bg-gray-50 rounded-t-lg font-semibold'):
+        ui.label('Case ID').classes('w-28')
+        ui.label('Employee').classes('flex-1')
+        ui.label('Type').classes('w-32')
+        ui.label('Security Level').classes('w-28')
+        ui.label('Status').classes('w-32')
+        ui.label('Progress').classes('w-24 text-center')
+        ui.label('Actions').classes('w-32 text-center')
+    
+    for record in active_records:
+        with ui.row().classes('w-full p-4 border-b border-gray-200 hover:bg-gray-50'):
+            ui.label(record.id).classes('w-28 font-mono text-sm')
             
-            for record in active_records:
-                security_color = 'text-red-600' if record.get("security_level") == "High" else 'text-yellow-600' if record.get("security_level") == "Medium" else 'text-green-600'
-                
-                with ui.row().classes('w-full p-4 border-b border-gray-200 hover:bg-gray-50'):
-                    ui.label(record['id']).classes('w-28 font-mono text-sm')
-                    
-                    with ui.column().classes('flex-1'):
-                        ui.label(record["employee_name"]).classes('font-medium')
-                        ui.label(f'Effective: {record["effective_date"]}').classes('text-sm text-gray-500')
-                    
-                    ui.chip(record['termination_type'], color='gray').props('dense').classes('w-32')
-                    
-                    ui.label(record.get('security_level', 'Low')).classes(f'w-28 font-bold {security_color}')
-                    
-                    status_color = 'yellow' if 'Pending' in record['status'] else 'blue'
-                    ui.chip(record['status'], color=status_color).props('dense').classes('w-32')
-                    
-                    # Progress indicator
-                    progress = (record.get('documentation_complete', 0) + record.get('clearance_progress', 0)) // 2
-                    progress_color = 'text-green-600' if progress >= 80 else 'text-yellow-600' if progress >= 50 else 'text-red-600'
-                    ui.label(f'{progress}%').classes(f'w-24 text-center font-bold {progress_color}')
-                    
-                    with ui.row().classes('w-32 justify-center gap-1'):
-                        ui.button(icon='visibility', on_click=lambda r=record: view_termination_details(r)).props('size=sm flat color=blue')
-                        ui.button(icon='edit', on_click=lambda r=record: edit_termination_record(r)).props('size=sm flat color=orange')
+            with ui.column().classes('flex-1'):
+                ui.label(record.employee_name).classes('font-medium')
+                ui.label(f'Effective: {record.effective_date}').classes('text-sm text-gray-500')
+            
+            ui.chip(record.termination_type, color='gray').props('dense').classes('w-32')
+            
+            ui.label(record.security_level or 'Low').classes(record.security_classes)
+            
+            ui.chip(record.status, color=record.status_color).props('dense').classes('w-32')
+            
+            # Progress indicator
+            ui.label(f'{record.progress}%').classes(record.progress_classes)
+            
+            with ui.row().classes('w-32 justify-center gap-1'):
+                ui.button(icon='visibility', on_click=partial(view_termination_details, record)).props('size=sm flat color=blue')
+                ui.button(icon='edit', on_click=partial(edit_termination_record, record)).props('size=sm flat color=orange')
 
 def create_new_termination_section():
     """Create new termination initiation form with security validation"""
-    with ui.card().classes('w-full p-6'):
+    with ui.card().classes('w-full p-6') as form_card:
         ui.label('Initiate Employee Termination').classes('text-xl font-semibold mb-4')
         
         # Security warning
@@ -734,15 +1271,13 @@ def create_new_termination_section():
                 ui.label('Employee Information').classes('font-semibold text-lg text-red-600 mb-3')
                 
                 # Employee selection with security info
-                employee_options = [f"{emp['id']} - {emp['name']} ({emp['department']})" for emp in termination_manager.employees]
-                employee_select = ui.select(options=employee_options, label='Select Employee').props('outlined').classes('w-full mb-3')
+                employee_select = ui.select(options=termination_manager.employee_display_options, label='Select Employee').props('outlined').classes('w-full mb-3')
                 
                 # Security information display
                 security_info_display = ui.element('div').classes('p-3 border rounded-lg mb-3 bg-gray-50')
                 
                 # Termination type selection
-                termination_types = list(termination_manager.termination_types.keys())
-                termination_type_select = ui.select(options=termination_types, label='Termination Type').props('outlined').classes('w-full mb-3')
+                termination_type_select = ui.select(options=termination_manager.termination_type_names, label='Termination Type').props('outlined').classes('w-full mb-3')
                 
                 ui.label('Initiation Date').classes('text-sm font-medium text-gray-700 mb-1')
                 initiation_date_input = ui.date(value=date.today()).props('outlined').classes('w-full mb-3')
@@ -774,51 +1309,65 @@ def create_new_termination_section():
             ui.label('🛡️ Security Risk Assessment').classes('font-semibold text-gray-700')
             security_score_display = ui.label('Select employee and termination type for assessment').classes('text-blue-600 ml-4 font-bold')
         
-        # Update security info when selections change
+        # Update security info when selections change; each panel is only rebuilt
+        # when its content differs from what is already displayed
+        last_state = {}
+        
         def update_security_assessment():
             if employee_select.value and termination_type_select.value:
                 # Extract employee ID from selection
-                employee_id = employee_select.value.split(' - ')[0]
-                employee = next((emp for emp in termination_manager.employees if emp["id"] == employee_id), None)
+                employee_id = employee_select.value.partition(' - ')[0]
+                assessment = _compute_assessment(
+                    employee_id,
+                    termination_type_select.value,
+                    _iso_date(initiation_date_input.value),
+                    _iso_date(effective_date_input.value)
+                )
+                if assessment is None:
+                    return
+                security_score, score_classes, required_docs, profile = assessment
                 
-                if employee:
-                    # Update security info display
+                # Update security info display
+                if profile != last_state.get('profile'):
+                    last_state['profile'] = profile
+                    clearance, access_level, direct_reports, critical_projects = profile
                     security_info_display.clear()
                     with security_info_display:
                         ui.label('Employee Security Profile').classes('font-semibold text-blue-600 mb-2')
-                        ui.label(f'Security Clearance: {employee.get("security_clearance", "Unknown")}').classes('text-sm')
-                        ui.label(f'Access Level: {employee.get("access_level", "Unknown")}').classes('text-sm')
-                        ui.label(f'Direct Reports: {employee.get("direct_reports", 0)}').classes('text-sm')
-                        if employee.get("critical_projects"):
-                            ui.label(f'Critical Projects: {", ".join(employee["critical_projects"])}').classes('text-sm text-red-600')
-                    
-                    # Update documentation requirements
-                    termination_config = termination_manager.termination_types.get(termination_type_select.value, {})
+                        ui.label(f'Security Clearance: {clearance}').classes('text-sm')
+                        ui.label(f'Access Level: {access_level}').classes('text-sm')
+                        ui.label(f'Direct Reports: {direct_reports}').classes('text-sm')
+                        if critical_projects:
+                            ui.label(f'Critical Projects: {critical_projects}').classes('text-sm text-red-600')
+                
+                # Update documentation requirements
+                if required_docs != last_state.get('required_docs'):
+                    last_state['required_docs'] = required_docs
                     documentation_list.clear()
                     with documentation_list:
                         ui.label('Required Documents:').classes('font-semibold mb-2')
-                        for doc in termination_config.get('documentation_required', []):
+                        for doc in required_docs:
                             ui.label(f'• {doc}').classes('text-sm text-gray-700')
-                    
-                    # Calculate security score
-                    mock_termination_data = {
-                        "employee_id": employee_id,
-                        "termination_type": termination_type_select.value,
-                        "initiation_date": initiation_date_input.value.strftime("%Y-%m-%d") if initiation_date_input.value else "",
-                        "effective_date": effective_date_input.value.strftime("%Y-%m-%d") if effective_date_input.value else "",
-                        "documentation_provided": []
-                    }
-                    
-                    security_score = termination_manager.calculate_security_score(mock_termination_data)
-                    score_color = 'text-green-600' if security_score >= 80 else 'text-yellow-600' if security_score >= 60 else 'text-red-600'
+                
+                # Update security score
+                if (security_score, score_classes) != last_state.get('score'):
+                    last_state['score'] = (security_score, score_classes)
                     security_score_display.text = f'Security Score: {security_score}%'
-                    security_score_display.classes(f'{score_color} ml-4 font-bold')
+                    security_score_display.classes(score_classes)
+        
+        def schedule_security_assessment():
+            # Debounce: a burst of field changes results in a single assessment pass
+            pending = last_state.get('timer')
+            if pending is not None:
+                pending.cancel()
+            with form_card:
+                last_state['timer'] = ui.timer(0.15, update_security_assessment, once=True)
         
         # Bind security assessment updates
-        employee_select.on('update:model-value', lambda: update_security_assessment())
-        termination_type_select.on('update:model-value', lambda: update_security_assessment())
-        initiation_date_input.on('update:model-value', lambda: update_security_assessment())
-        effective_date_input.on('update:model-value', lambda: update_security_assessment())
+        employee_select.on('update:model-value', schedule_security_assessment)
+        termination_type_select.on('update:model-value', schedule_security_assessment)
+        initiation_date_input.on('update:model-value', schedule_security_assessment)
+        effective_date_input.on('update:model-value', schedule_security_assessment)
         
         # Action buttons
         with ui.row().classes('w-full justify-end gap-2 mt-6'):
@@ -832,12 +1381,44 @@ def create_new_termination_section():
                 security_escort_checkbox.value, confidential_data_checkbox.value
             )).props('color=red')
 
-def create_completed_terminations_section():
+@lru_cache(maxsize=128)
+def _compute_assessment(employee_id, termination_type, initiation_date, effective_date):
+    """Security assessment shown while filling in the termination form
+    
+    Returns (security_score, score_classes, required_docs, profile), or None for an
+    unknown employee. Cached because every form field change re-runs it.
+    """
+    employee = termination_manager._find_employee(employee_id)
+    if not employee:
+        return None
+    
+    profile = (
+        employee.get("security_clearance", "Unknown"),
+        employee.get("access_level", "Unknown"),
+        employee.get("direct_reports", 0),
+        ", ".join(employee.get("critical_projects") or ())
+    )
+    termination_config = termination_manager.termination_types.get(termination_type, {})
+    required_docs = tuple(termination_config.get('documentation_required', ()))
+    
+    security_score = termination_manager.calculate_security_score({
+        "employee_id": employee_id,
+        "termination_type": termination_type,
+        "initiation_date": initiation_date,
+        "effective_date": effective_date,
+        "documentation_provided": []
+    })
+    score_classes = ASSESSMENT_SCORE_CLASSES[_bucket(security_score, 60, 80)]
+    
+    return security_score, score_classes, required_docs, profile
+
+def create_completed_terminations_section(snapshot=None):
     """Create completed terminations archive"""
+    snapshot = snapshot or _snapshot_records()
     with ui.card().classes('w-full p-6'):
         ui.label('Completed Terminations Archive').classes('text-xl font-semibold mb-4')
         
-        completed_records = [r for r in termination_manager.get_termination_records() if r["status"] == "Completed"]
+        completed_records = snapshot.completed
         
         if completed_records:
             # Archive table with security indicators
@@ -849,22 +1430,82 @@ def create_completed_terminations_section():
                 ui.label('Security Score').classes('w-28 text-center')
                 ui.label('Actions').classes('w-24 text-center')
             
-            for record in completed_records:
-                with ui.row().classes('w-full p-4 border-b border-gray-200 hover:bg-gray-50'):
-                    ui.label(record['id']).classes('w-28 font-mono text-sm')
-                    ui.label(record["employee_name"]).classes('flex-1 font-medium')
-                    ui.chip(record['termination_type'], color='gray').props('dense').classes('w-32')
-                    ui.label(record["effective_date"]).classes('w-32 text-sm')
-                    
-                    score_color = 'text-green-600' if record['security_score'] >= 80 else 'text-yellow-600' if record['security_score'] >= 60 else 'text-red-600'
-                    ui.label(f"{record['security_score']}%").classes(f'w-28 text-center font-bold {score_color}')
-                    
-                    ui.button(icon='visibility', on_click=lambda r=record: view_termination_details(r)).props('size=sm flat color=blue').classes('w-24')
+            # Rows are rendered a page at a time so large archives stay cheap to open
+            pending_records = iter(completed_records)
+            archive_state = {'shown': 0}
+            live_rows = deque()
+            fold_older_records = _create_older_records()
+            archive_rows = ui.column().classes('w-full gap-0')
+            
+            def load_more_records():
+                with archive_rows:
+                    for record in islice(pending_records, ARCHIVE_PAGE_SIZE):
+                        live_rows.append((record, _render_completed_row(record)))
+                        archive_state['shown'] += 1
+                if len(live_rows) > ARCHIVE_MAX_LIVE_ROWS:
+                    # Keep the live element count bounded by folding the oldest half away
+                    folded = [live_rows.popleft() for _ in range(len(live_rows) // 2)]
+                    for _, row in folded:
+                        row.delete()
+                    fold_older_records([record for record, _ in folded])
+                remaining = len(completed_records) - archive_state['shown']
+                load_more_button.text = f'Load more ({remaining} remaining)'
+                load_more_button.set_visibility(remaining > 0)
+            
+            load_more_button = ui.button(on_click=load_more_records).props('flat color=gray').classes('w-full mt-2')
+            load_more_records()
         else:
             ui.label('No completed terminations found').classes('text-gray-500 text-center py-8')
 
+def _render_completed_row(record):
+    """Render one row of the completed terminations archive"""
+    with ui.row().classes('w-full p-4 border-b border-gray-200 hover:bg-gray-50') as row:
+        ui.label(record.id).classes('w-28 font-mono text-sm')
+        ui.label(record.employee_name).classes('flex-1 font-medium')
+        ui.chip(record.termination_type, color='gray').props('dense').classes('w-32')
+        ui.label(record.effective_date).classes('w-32 text-sm')
+        ui.label(f"{record.security_score}%").classes(record.score_classes)
+        
+        ui.button(icon='visibility', on_click=partial(view_termination_details, record)).props('size=sm flat color=blue').classes('w-24')
+    return row
+
+def _create_older_records():
+    """One expansion for archive rows folded out of view; returns the function that folds more rows in
+    
+    Folded rows are rendered a page at a time, starting when the expansion is first opened.
+    """
+    records = []
+    state = {'shown': 0}
+    expansion = ui.expansion(icon='history').classes('w-full')
+    with expansion:
+        older_rows = ui.column().classes('w-full gap-0')
+        show_more_button = ui.button(on_click=lambda: render_page()).props('flat color=gray').classes('w-full mt-2')
+    
+    def update_labels():
+        expansion.set_text(f'Older records ({len(records)}) - click to expand')
+        remaining = len(records) - state['shown']
+        show_more_button.text = f'Show more ({remaining} remaining)'
+        show_more_button.set_visibility(0 < state['shown'] < len(records))
+    
+    def render_page():
+        with older_rows:
+            for record in records[state['shown']:state['shown'] + ARCHIVE_PAGE_SIZE]:
+                _render_completed_row(record)
+        state['shown'] = min(state['shown'] + ARCHIVE_PAGE_SIZE, len(records))
+        update_labels()
+    
+    def fold(new_records):
+        records.extend(new_records)
+        expansion.set_visibility(True)
+        update_labels()
+    
+    expansion.on_value_change(lambda e: render_page() if e.value and state['shown'] == 0 else None)
+    expansion.set_visibility(False)
+    return fold
+
 def create_security_analytics_section():
     """Create security analytics and monitoring"""
+    security_metrics = termination_manager.compute_security_metrics()
     with ui.card().classes('w-full p-6'):
         ui.label('🛡️ Security Analytics Dashboard').classes('text-xl font-semibold mb-4')
         
@@ -874,10 +1515,10 @@ def create_security_analytics_section():
                 ui.label('Security Metrics').classes('font-semibold text-red-600 mb-3')
                 
                 metrics = [
-                    {"label": "High Security Cases", "value": "3", "trend": "↑"},
-                    {"label": "Average Security Score", "value": "87%", "trend": "→"},
-                    {"label": "Compliance Rate", "value": "98%", "trend": "↑"},
-                    {"label": "Audit Findings", "value": "0", "trend": "↓"}
+                    {"label": "High Security Cases", "value": str(security_metrics.high_security_cases), "trend": "↑"},
+                    {"label": "Average Security Score", "value": f"{security_metrics.avg_security_score}%", "trend": "→"},
+                    {"label": "Compliance Rate", "value": f"{security_metrics.compliance_rate}%", "trend": "↑"},
+                    {"label": "Audit Findings", "value": str(security_metrics.audit_findings), "trend": "↓"}
                 ]
                 
                 for metric in metrics:
@@ -892,10 +1533,10 @@ def create_security_analytics_section():
                 ui.label('Risk Assessment').classes('font-semibold text-orange-600 mb-3')
                 
                 risk_factors = [
-                    {"factor": "Privileged Access Users", "level": "Medium", "count": 2},
-                    {"factor": "Critical Project Members", "level": "High", "count": 1},
-                    {"factor": "Immediate Terminations", "level": "Low", "count": 0},
-                    {"factor": "Documentation Gaps", "level": "Low", "count": 1}
+                    {"factor": "Privileged Access Users", "level": "Medium", "count": security_metrics.privileged_access_users},
+                    {"factor": "Critical Project Members", "level": "High", "count": security_metrics.critical_project_members},
+                    {"factor": "Immediate Terminations", "level": "Low", "count": security_metrics.immediate_terminations},
+                    {"factor": "Documentation Gaps", "level": "Low", "count": security_metrics.documentation_gaps}
                 ]
                 
                 for risk in risk_factors:
@@ -911,30 +1552,27 @@ def create_termination_policies_section():
     with ui.card().classes('w-full p-6'):
         ui.label('📋 Termination Policies & Procedures').classes('text-xl font-semibold mb-4')
         
-        for termination_type, config in termination_manager.termination_types.items():
+        for termination_type, details, documents, checklist in POLICY_ROWS:
             with ui.expansion(termination_type, icon='policy').classes('w-full mb-2'):
                 with ui.column().classes('p-4'):
                     with ui.grid(columns=2).classes('gap-4'):
                         # Left column
                         with ui.column():
                             ui.label('Policy Details').classes('font-semibold text-blue-600 mb-2')
-                            ui.label(f'Code: {config["code"]}').classes('text-sm mb-1')
-                            ui.label(f'Notice Period: {config["notice_period_days"]} days').classes('text-sm mb-1')
-                            ui.label(f'Security Level: {config["security_level"]}').classes('text-sm mb-1')
-                            ui.label(f'Approval Required: {"Yes" if config["requires_approval"] else "No"}').classes('text-sm mb-1')
-                            ui.label(f'Exit Interview: {"Required" if config["exit_interview_required"] else "Optional"}').classes('text-sm mb-1')
+                            for text in details:
+                                ui.label(text).classes('text-sm mb-1')
                         
                         # Right column
                         with ui.column():
                             ui.label('Requirements').classes('font-semibold text-green-600 mb-2')
                             
                             ui.label('Documentation Required:').classes('text-sm font-medium mb-1')
-                            for doc in config["documentation_required"]:
-                                ui.label(f'• {doc}').classes('text-sm text-gray-700')
+                            for text in documents:
+                                ui.label(text).classes('text-sm text-gray-700')
                             
                             ui.label('Clearance Checklist:').classes('text-sm font-medium mt-2 mb-1')
-                            for item in config["clearance_checklist"]:
-                                ui.label(f'• {item}').classes('text-sm text-gray-700')
+                            for text in checklist:
+                                ui.label(text).classes('text-sm text-gray-700')
 
 # Action functions with security logging
 async def submit_termination_request(employee_selection, termination_type, initiation_date, effective_date, reason, immediate_access, security_escort, confidential_data):
@@ -944,8 +1582,9 @@ async def submit_termination_request(employee_selection, termination_type, initi
         return
     
     # Extract employee ID
-    employee_id = employee_selection.split(' - ')[0]
-    employee_name = employee_selection.split(' - ')[1].split(' (')[0]
+    # Options are "ID - Name (Department)"; parse the selection once
+    employee_id, _, employee_label = employee_selection.partition(' - ')
+    employee_name = employee_label.partition(' (')[0]
     
     # Validate dates
     if effective_date <= initiation_date:
@@ -957,8 +1596,8 @@ async def submit_termination_request(employee_selection, termination_type, initi
         "employee_id": employee_id,
         "employee_name": employee_name,
         "termination_type": termination_type,
-        "initiation_date": initiation_date.strftime("%Y-%m-%d"),
-        "effective_date": effective_date.strftime("%Y-%m-%d"),
+        "initiation_date": _iso_date(initiation_date),
+        "effective_date": _iso_date(effective_date),
         "reason": reason,
         "immediate_access_revocation": immediate_access,
         "security_escort_required": security_escort,
@@ -977,6 +1616,7 @@ async def submit_termination_request(employee_selection, termination_type, initi
     
     if success:
         ui.notify(f'Termination case initiated successfully! Case ID: {record_id}', color='positive')
+        _render_active_body.refresh(_snapshot_records().active)
         
         # Show security confirmation dialog
         with ui.dialog() as dialog, ui.card().classes('w-96 p-6'):
@@ -1011,13 +1651,13 @@ async def validate_termination_request(employee_selection, termination_type, ini
         ui.notify('Please select employee and termination type', color='warning')
         return
     
-    employee_id = employee_selection.split(' - ')[0]
+    employee_id = employee_selection.partition(' - ')[0]
     
     termination_data = {
         "employee_id": employee_id,
         "termination_type": termination_type,
-        "initiation_date": initiation_date.strftime("%Y-%m-%d") if initiation_date else "",
-        "effective_date": effective_date.strftime("%Y-%m-%d") if effective_date else "",
+        "initiation_date": _iso_date(initiation_date),
+        "effective_date": _iso_date(effective_date),
         "reason": reason
     }
     
@@ -1052,33 +1692,33 @@ async def validate_termination_request(employee_selection, termination_type, ini
 async def view_termination_details(record):
     """View detailed termination record with security information"""
     with ui.dialog() as dialog, ui.card().classes('w-[700px] p-6'):
-        ui.label(f'Termination Case Details - {record["id"]}').classes('text-xl font-semibold mb-4')
+        ui.label(f'Termination Case Details - {record.id}').classes('text-xl font-semibold mb-4')
         
         with ui.grid(columns=2).classes('gap-4 w-full'):
             # Left column
             with ui.column().classes('gap-3'):
                 ui.label('Case Information').classes('font-semibold text-blue-600')
-                ui.label(f'Employee: {record["employee_name"]}').classes('text-sm')
-                ui.label(f'Type: {record["termination_type"]}').classes('text-sm')
-                ui.label(f'Initiation Date: {record["initiation_date"]}').classes('text-sm')
-                ui.label(f'Effective Date: {record["effective_date"]}').classes('text-sm')
-                ui.label(f'Status: {record["status"]}').classes('text-sm')
+                ui.label(f'Employee: {record.employee_name}').classes('text-sm')
+                ui.label(f'Type: {record.termination_type}').classes('text-sm')
+                ui.label(f'Initiation Date: {record.initiation_date}').classes('text-sm')
+                ui.label(f'Effective Date: {record.effective_date}').classes('text-sm')
+                ui.label(f'Status: {record.status}').classes('text-sm')
             
             # Right column
             with ui.column().classes('gap-3'):
                 ui.label('Security Information').classes('font-semibold text-red-600')
-                ui.label(f'Security Level: {record.get("security_level", "Unknown")}').classes('text-sm')
-                ui.label(f'Security Score: {record["security_score"]}%').classes('text-sm')
-                ui.label(f'Approval Stage: {record["approval_stage"]}').classes('text-sm')
-                ui.label(f'Documentation: {record.get("documentation_complete", 0)}%').classes('text-sm')
-                ui.label(f'Clearance Progress: {record.get("clearance_progress", 0)}%').classes('text-sm')
+                ui.label(f'Security Level: {record.security_level or "Unknown"}').classes('text-sm')
+                ui.label(f'Security Score: {record.security_score}%').classes('text-sm')
+                ui.label(f'Approval Stage: {record.approval_stage}').classes('text-sm')
+                ui.label(f'Documentation: {record.documentation_complete}%').classes('text-sm')
+                ui.label(f'Clearance Progress: {record.clearance_progress}%').classes('text-sm')
         
         ui.label('Reason:').classes('font-semibold text-purple-600 mt-4')
-        ui.label(record["reason"]).classes('text-sm bg-gray-50 p-3 rounded')
+        ui.label(record.reason).classes('text-sm bg-gray-50 p-3 rounded')
         
-        if record.get("audit_hash"):
+        if record.audit_hash_display:
             ui.label('Audit Information:').classes('font-semibold text-gray-600 mt-4')
-            ui.label(f'Audit Hash: {record["audit_hash"][:16]}...').classes('text-xs font-mono bg-gray-100 p-2 rounded')
+            ui.label(record.audit_hash_display).classes('text-xs font-mono bg-gray-100 p-2 rounded')
         
         with ui.row().classes('w-full justify-end mt-6'):
             ui.button('Close', on_click=dialog.close).props('flat')
@@ -1087,7 +1727,7 @@ async def view_termination_details(record):
 
 async def edit_termination_record(record):
     """Edit termination record with security controls"""
-    ui.notify(f'Edit case {record["id"]} - Enhanced security controls required', color='info')
+    ui.notify(f'Edit case {record.id} - Enhanced security controls required', color='info')
 
 
 
@@ -1095,14 +1735,8 @@ async def edit_termination_record(record):
 def get_termination_records_for_approval(approver_id, security_clearance):
     """API for managers to get termination records requiring approval"""
     # Security filtering based on clearance level
-    allowed_levels = {
-        "High": ["Low", "Medium", "High"],
-        "Medium": ["Low", "Medium"],
-        "Low": ["Low"]
-    }
-    
-    filter_levels = allowed_levels.get(security_clearance, ["Low"])
-    return termination_manager.get_termination_records(filter_levels)
+    mask = CLEARANCE_MASK.get(security_clearance, LEVEL_BIT["Low"])
+    return termination_manager.get_termination_records(mask)
 
 def approve_termination_record(record_id, approver_id, security_clearance):
     """API for approving termination records with security validation"""
@@ -1110,113 +1744,108 @@ def approve_termination_record(record_id, approver_id, security_clearance):
     return termination_manager.update_termination_status(record_id, "Approved", approver_id)
 
 # Modern dialog functions for termination page
-async def show_security_audit():
-    """Show security audit dialog"""
+# Dialogs are built once per client and reopened: client id -> {builder name -> builder result}
+_dialog_cache = {}
+
+def _forget_client_dialogs(client):
+    """Drop a disconnected client's cached dialogs"""
+    _dialog_cache.pop(client.id, None)
+
+def _cached_dialog(builder):
+    """Return the current client's result of builder, building it on first use"""
+    client = ui.context.client
+    dialogs = _dialog_cache.get(client.id)
+    if dialogs is None:
+        dialogs = _dialog_cache[client.id] = {}
+        client.on_disconnect(_forget_client_dialogs)
+    built = dialogs.get(builder.__name__)
+    if built is None:
+        built = dialogs[builder.__name__] = builder()
+    return built
+
+def _build_security_audit_dialog():
+    """Build the security audit dialog (once per client, see _cached_dialog)"""
     with ui.dialog() as dialog, ui.card().classes('w-4xl max-w-4xl p-8'):
-        ui.html('''
-            <div class="flex items-center gap-3 mb-6">
-                <div class="bg-red-500 text-white p-3 rounded-full">
-                    <i class="material-icons text-2xl">shield</i>
-                </div>
-                <div>
-                    <h2 class="text-2xl font-bold text-red-800">Security Audit Trail</h2>
-                    <p class="text-red-600">Complete audit history and security monitoring</p>
-                </div>
-            </div>
-        ''', sanitize=False)
-        
-        with ui.row().classes('w-full gap-6'):
-            # Left column - Recent audits
-            with ui.column().classes('flex-1'):
-                ui.label('🔒 Recent Security Events').classes('text-xl font-semibold text-gray-800 mb-4')
-                with ui.card().classes('p-4 max-h-80 overflow-y-auto'):
-                    audit_events = [
-                        {"timestamp": "2025-10-12 14:30", "event": "Dual Authorization Required", "user": "admin@company.com", "level": "HIGH"},
-                        {"timestamp": "2025-10-12 12:15", "event": "Access Revoked", "user": "hr@company.com", "level": "MEDIUM"},
-                        {"timestamp": "2025-10-12 10:45", "event": "Document Accessed", "user": "manager@company.com", "level": "LOW"},
-                        {"timestamp": "2025-10-12 09:20", "event": "Security Check Passed", "user": "security@company.com", "level": "INFO"}
-                    ]
-                    
-                    for event in audit_events:
-                        with ui.row().classes('w-full items-center justify-between p-2 hover:bg-gray-50 rounded'):
-                            with ui.column().classes('gap-1'):
-                                ui.label(event['event']).classes('font-medium text-sm')
-                                ui.label(f"{event['timestamp']} - {event['user']}").classes('text-xs text-gray-500')
-                            level_colors = {"HIGH": "text-red-600", "MEDIUM": "text-orange-600", "LOW": "text-yellow-600", "INFO": "text-blue-600"}
-                            ui.label(event['level']).classes(f'text-xs font-bold {level_colors[event["level"]]}')
-            
-            # Right column - Security stats
-            with ui.column().classes('flex-1'):
-                ui.label('📊 Security Statistics').classes('text-xl font-semibold text-gray-800 mb-4')
-                with ui.card().classes('p-4'):
-                    ui.html('''
-                        <div class="space-y-4">
-                            <div class="flex justify-between items-center">
-                                <span class="font-medium">Total Audit Events</span>
-                                <span class="text-blue-600 font-bold">1,247</span>
-                            </div>
-                            <div class="flex justify-between items-center">
-                                <span class="font-medium">High Security Events</span>
-                                <span class="text-red-600 font-bold">15</span>
-                            </div>
-                            <div class="flex justify-between items-center">
-                                <span class="font-medium">Compliance Score</span>
-                                <span class="text-green-600 font-bold">98.7%</span>
-                            </div>
-                            <div class="flex justify-between items-center">
-                                <span class="font-medium">Failed Authorizations</span>
-                                <span class="text-orange-600 font-bold">3</span>
-                            </div>
-                        </div>
-                    ''', sanitize=False)
+        with ui.row().classes('items-center gap-3 mb-6'):
+            with ui.element('div').classes('bg-red-500 text-white p-3 rounded-full'):
+                ui.icon('shield').classes('text-2xl')
+            with ui.column().classes('gap-0'):
+                ui.label('Security Audit Trail').classes('text-2xl font-bold text-red-800')
+                ui.label('Complete audit history and security monitoring').classes('text-red-600')
+        
+        # The columns are filled in on the next tick so the dialog frame opens right away
+        body = ui.row().classes('w-full gap-6')
+        
+        def populate_audit_body():
+            with body:
+                # Left column - Recent audits
+                with ui.column().classes('flex-1'):
+                    ui.label('🔒 Recent Security Events').classes('text-xl font-semibold text-gray-800 mb-4')
+                    with ui.card().classes('p-4 max-h-80 overflow-y-auto'):
+                        # One html element for the whole list instead of a row/column/labels per event
+                        ui.html(_AUDIT_EVENTS_HTML, sanitize=False)
+                
+                # Right column - Security stats
+                with ui.column().classes('flex-1'):
+                    ui.label('📊 Security Statistics').classes('text-xl font-semibold text-gray-800 mb-4')
+                    with ui.card().classes('p-4'):
+                        ui.html(_AUDIT_STATISTICS_HTML, sanitize=False)
         
         ui.button('Close', on_click=dialog.close).props('flat color=red').classes('mt-6')
-    dialog.open()
+        ui.timer(0.01, populate_audit_body, once=True)
+    return dialog
 
-async def show_new_termination_dialog():
-    """Show new termination creation dialog"""
+async def show_security_audit():
+    """Show security audit dialog"""
+    _cached_dialog(_build_security_audit_dialog).open()
+
+# The new termination dialog and the inputs that are reset each time it opens
+_NewTerminationForm = namedtuple('_NewTerminationForm', 'dialog employee_select termination_type effective_date reason_input immediate_access security_escort')
+
+def _build_new_termination_dialog():
+    """Build the new termination dialog (once per client, see _cached_dialog)"""
     with ui.dialog() as dialog, ui.card().classes('w-3xl max-w-3xl p-8'):
-        ui.html('''
-            <div class="flex items-center gap-3 mb-6">
-                <div class="bg-red-500 text-white p-3 rounded-full">
-                    <i class="material-icons text-2xl">person_remove</i>
-                </div>
-                <div>
-                    <h2 class="text-2xl font-bold text-red-800">Initiate Employee Termination</h2>
-                    <p class="text-red-600">⚠️ High security process - requires dual authorization</p>
-                </div>
-            </div>
-        ''', sanitize=False)
+        ui.html(_NEW_TERMINATION_DIALOG_HEADER_HTML, sanitize=False)
         
         # Security warning
         with ui.card().classes('p-4 bg-red-50 border-l-4 border-red-500 mb-6'):
-            ui.html('''
-                <div class="flex items-center gap-2">
-                    <i class="material-icons text-red-500">warning</i>
-                    <div>
-                        <div class="font-semibold text-red-800">Security Notice</div>
-                        <div class="text-sm text-red-700">This action requires additional authorization for high-risk employees</div>
-                    </div>
-                </div>
-            ''', sanitize=False)
+            ui.html(_SECURITY_NOTICE_HTML, sanitize=False)
         
         # Quick termination form
         with ui.row().classes('w-full gap-4 mb-4'):
-            employee_select = ui.select(['EMP-001 - John Smith (High Risk)', 'EMP-002 - Sarah Johnson'], 
-                label='Select Employee').classes('flex-1')
-            termination_type = ui.select(['Voluntary Resignation', 'End of Contract', 'Dismissal for Cause', 'Redundancy'], 
-                label='Termination Type').classes('flex-1')
+            employee_select = ui.select(_DIALOG_EMPLOYEE_OPTIONS, label='Select Employee').classes('flex-1')
+            termination_type = ui.select(_DIALOG_TERMINATION_TYPES, label='Termination Type').classes('flex-1')
         
         effective_date = ui.date('Effective Date').classes('w-full mb-4')
         reason_input = ui.textarea('Reason', placeholder='Provide detailed reason for termination...').props('rows=3').classes('w-full mb-4')
         
         # Security options
         with ui.row().classes('w-full gap-4 mb-4'):
-            ui.checkbox('Immediate access revocation required').classes('text-red-600')
-            ui.checkbox('Security escort required').classes('text-orange-600')
+            immediate_access = ui.checkbox('Immediate access revocation required').classes('text-red-600')
+            security_escort = ui.checkbox('Security escort required').classes('text-orange-600')
         
         with ui.row().classes('gap-2 justify-end'):
             ui.button('Cancel', on_click=dialog.close).props('flat')
-            ui.button('Initiate Termination', on_click=lambda: [ui.notify('Termination process initiated - pending authorization', color='warning'), dialog.close()]).props('color=red')
-    
-    dialog.open()
\ No newline at end of file
+            ui.button('Initiate Termination', on_click=partial(_initiate_quick_termination, dialog)).props('color=red')
+    return _NewTerminationForm(dialog, employee_select, termination_type, effective_date, reason_input, immediate_access, security_escort)
+
+def _initiate_quick_termination(dialog):
+    """Handle the quick termination dialog submit"""
+    # Both changes go out in the same outbox flush after the handler returns
+    ui.notify('Termination process initiated - pending authorization', color='warning')
+    dialog.close()
+
+def _reset_new_termination_form(form):
+    """Clear the inputs of a reused new termination dialog"""
+    form.employee_select.value = None
+    form.termination_type.value = None
+    form.effective_date.value = None
+    form.reason_input.value = ''
+    form.immediate_access.value = False
+    form.security_escort.value = False
+
+async def show_new_termination_dialog():
+    """Show new termination creation dialog"""
+    form = _cached_dialog(_build_new_termination_dialog)
+    _reset_new_termination_form(form)
+    form.dialog.open()
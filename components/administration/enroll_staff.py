@@ -1,14 +1,114 @@
-from nicegui import ui, app
-from helperFuns import imagePath, emailValidation
+from nicegui import ui, app, core
+from helperFuns import imagePath
 from assets import FlipCards, SearchBox
 import asyncio
 from datetime import datetime, date
 import json
 import uuid
 import re
+import threading
+from functools import lru_cache
+from collections import defaultdict
+from types import MappingProxyType
+from dataclasses import dataclass
+from typing import Optional
 
 # Import institution data for integration
-from .institution_profile import data_manager as institution_data_manager
+from .institution_profile import get_data_manager as get_institution_data_manager
+
+# Institution data as of the last institution data manager version seen
+_institution_cache = {'data': None, 'version': -1}
+
+def _get_cached_institution():
+    """Institution data, fetched again only after the institution profile changes"""
+    institution_data_manager = get_institution_data_manager()
+    version = institution_data_manager.version
+    if _institution_cache['version'] != version:
+        _institution_cache['data'] = institution_data_manager.get_institution_data()
+        _institution_cache['version'] = version
+    return _institution_cache['data']
+
+# Institution banner classes, shared by every render of the enrollment page
+_BANNER_CLS = 'w-full p-6 mb-8 bg-gradient-to-r from-green-50 to-blue-50 border-l-4 border-green-500 shadow-md'
+_BANNER_ROW_CLS = 'items-center justify-between w-full'
+_BANNER_TITLE_CLS = 'text-xl font-bold text-gray-800'
+_BANNER_STATS_CLS = 'text-sm text-gray-600 font-medium'
+
+@lru_cache(maxsize=1)
+def _banner_labels(name, total_employees, departments):
+    """Banner title and statistics line, rebuilt only when the institution figures change"""
+    return (f'Enrolling to: {name}',
+            f'Total Employees: {total_employees} | Departments: {departments}')
+
+# Enrollments within this window share a single institution statistics update
+STATS_FLUSH_DELAY_SECONDS = 0.25
+
+# Fields every enrollment must fill in, with their error messages built once
+_REQUIRED_FIELDS = ("first_name", "last_name", "email", "phone", "department", "position", "start_date")
+_REQUIRED_LABELS = {field: f"{field.replace('_', ' ').title()} is required" for field in _REQUIRED_FIELDS}
+
+# Maximal word runs of the employee search text; a query made of one such run can be
+# answered from the search trie
+_SEARCH_TOKEN_RE = re.compile(r'\w+')
+
+# Enrollment lookup tables (read-only; ui.select needs list copies of these)
+DEPARTMENTS = (
+    "Human Resources", "Information Technology", "Finance",
+    "Marketing", "Operations", "Sales", "Legal", "Administration"
+)
+POSITIONS = MappingProxyType({
+    "Human Resources": ("HR Manager", "HR Specialist", "Recruiter", "Training Coordinator"),
+    "Information Technology": ("Software Developer", "System Administrator", "IT Manager", "DevOps Engineer"),
+    "Finance": ("Accountant", "Financial Analyst", "Finance Manager", "Payroll Specialist"),
+    "Marketing": ("Marketing Manager", "Digital Marketer", "Content Creator", "Brand Manager"),
+    "Operations": ("Operations Manager", "Process Analyst", "Quality Assurance", "Operations Coordinator"),
+    "Sales": ("Sales Manager", "Sales Representative", "Account Manager", "Business Development"),
+    "Legal": ("Legal Counsel", "Compliance Officer", "Legal Assistant", "Contract Manager"),
+    "Administration": ("Administrative Assistant", "Office Manager", "Executive Assistant", "Receptionist")
+})
+# Position membership per department, for validation
+POSITION_SETS = MappingProxyType({dept: frozenset(positions) for dept, positions in POSITIONS.items()})
+EMPLOYMENT_TYPES = ("Full-time", "Part-time", "Contract", "Temporary", "Intern")
+SALARY_GRADES = ("Grade 1", "Grade 2", "Grade 3", "Grade 4", "Grade 5", "Grade 6", "Grade 7", "Grade 8")
+
+@dataclass(slots=True)
+class PersonalInfo:
+    first_name: str
+    last_name: str
+    email: str
+    phone: str
+    address: str = ""
+    date_of_birth: str = ""
+    ssn: str = ""
+    emergency_contact: str = ""
+    emergency_phone: str = ""
+
+@dataclass(slots=True)
+class EmploymentInfo:
+    department: str
+    position: str
+    employment_type: str
+    start_date: str
+    salary_grade: str = ""
+    reporting_manager: str = ""
+    work_location: str = ""
+    status: str = "Active"
+    termination_date: Optional[str] = None
+    termination_reason: Optional[str] = None
+
+@dataclass(slots=True)
+class SystemInfo:
+    created_date: str
+    last_updated: str
+    institution_id: str
+    created_by: str = "HR System"
+
+@dataclass(slots=True)
+class EmployeeProfile:
+    employee_id: str
+    personal_info: PersonalInfo
+    employment_info: EmploymentInfo
+    system_info: SystemInfo
 
 # Advanced Employee Data Management System
 class EmployeeDataManager:
@@ -17,75 +117,92 @@ class EmployeeDataManager:
     department integration, and automated employee ID generation
     """
     
+    departments = DEPARTMENTS
+    positions = POSITIONS
+    employment_types = EMPLOYMENT_TYPES
+    salary_grades = SALARY_GRADES
+    
     def __init__(self):
         self.employees = {}  # Store employee data
         self.next_employee_id = 1001  # Starting employee ID
-        self.departments = [
-            "Human Resources", "Information Technology", "Finance", 
-            "Marketing", "Operations", "Sales", "Legal", "Administration"
-        ]
-        self.positions = {
-            "Human Resources": ["HR Manager", "HR Specialist", "Recruiter", "Training Coordinator"],
-            "Information Technology": ["Software Developer", "System Administrator", "IT Manager", "DevOps Engineer"],
-            "Finance": ["Accountant", "Financial Analyst", "Finance Manager", "Payroll Specialist"],
-            "Marketing": ["Marketing Manager", "Digital Marketer", "Content Creator", "Brand Manager"],
-            "Operations": ["Operations Manager", "Process Analyst", "Quality Assurance", "Operations Coordinator"],
-            "Sales": ["Sales Manager", "Sales Representative", "Account Manager", "Business Development"],
-            "Legal": ["Legal Counsel", "Compliance Officer", "Legal Assistant", "Contract Manager"],
-            "Administration": ["Administrative Assistant", "Office Manager", "Executive Assistant", "Receptionist"]
-        }
-        self.employment_types = ["Full-time", "Part-time", "Contract", "Temporary", "Intern"]
-        self.salary_grades = ["Grade 1", "Grade 2", "Grade 3", "Grade 4", "Grade 5", "Grade 6", "Grade 7", "Grade 8"]
-        
-        # Validation patterns
-        self.validation_patterns = {
-            "email": r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$',
-            "phone": r'^\+?1?\d{9,15}$',
-            "ssn": r'^\d{3}-\d{2}-\d{4}$',
-            "employee_id": r'^EMP\d{4}$'
-        }
+        self._id_lock = threading.Lock()
+        # Guards the employee store and its indexes; enrollments are built in worker threads
+        self._lock = threading.Lock()
+        
+        # Validation patterns, compiled once and bound as whole-string matchers
+        self._match_email = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', re.ASCII).fullmatch
+        self._match_phone = re.compile(r'\+?1?\d{9,15}', re.ASCII).fullmatch
+        self._match_ssn = re.compile(r'\d{3}-\d{2}-\d{4}', re.ASCII).fullmatch
+        self._match_employee_id = re.compile(r'EMP\d{4}', re.ASCII).fullmatch
+        
+        # Search index: a trie over every suffix of each search token, so a one-word
+        # query is a single walk from the root. Each node holds the IDs below it.
+        self._search_trie = {}
+        self._employee_order = {}  # employee_id -> enrollment position, for result order
+        # Lowercased search text per employee, built once at enrollment
+        self._search_blobs = {}
+        
+        # Secondary indexes: department / status -> employee IDs (dicts keep enrollment order)
+        self._by_department = defaultdict(dict)
+        self._by_status = defaultdict(dict)
+        
+        # The institution statistics write is coalesced across a burst of enrollments
+        self._stats_dirty = False
     
     def generate_employee_id(self):
-        """Generate unique employee ID with algorithm"""
-        employee_id = f"EMP{self.next_employee_id}"
-        self.next_employee_id += 1
+        """Generate unique employee ID with algorithm (consumes the ID)"""
+        with self._id_lock:
+            employee_id = f"EMP{self.next_employee_id}"
+            self.next_employee_id += 1
         return employee_id
     
+    def peek_next_employee_id(self):
+        """The ID the next enrollment will receive, for previews (does not consume it)"""
+        return f"EMP{self.next_employee_id}"
+    
+    def is_valid_email(self, email):
+        """Check an email address against the enrollment email format
+        
+        Cheap structural checks reject most bad input before the regex runs;
+        the shortest valid address is "a@b.co".
+        """
+        if len(email) < 6 or '@' not in email or '.' not in email.rpartition('@')[2]:
+            return False
+        return self._match_email(email) is not None
+    
     def validate_employee_data(self, data):
         """Advanced validation algorithm for employee data"""
         errors = []
         
-        # Required fields validation
-        required_fields = ["first_name", "last_name", "email", "phone", "department", "position", "start_date"]
-        for field in required_fields:
-            if not data.get(field):
-                errors.append(f"{field.replace('_', ' ').title()} is required")
+        # Required fields validation; a partial submission is reported before any format checks run
+        errors.extend(_REQUIRED_LABELS[field] for field in _REQUIRED_FIELDS if not data.get(field))
+        if errors:
+            return errors
+        
+        # Department-Position validation
+        if data["position"] not in POSITION_SETS.get(data["department"], frozenset()):
+            errors.append("Position is not valid for the selected department")
         
         # Email validation
-        if data.get("email") and not re.match(self.validation_patterns["email"], data["email"]):
+        if not self.is_valid_email(data["email"]):
             errors.append("Invalid email format")
         
-        # Phone validation
-        if data.get("phone") and not re.match(self.validation_patterns["phone"], data["phone"]):
+        # Phone validation (at least 9 digits are required)
+        phone = data["phone"]
+        if len(phone) < 9 or not self._match_phone(phone):
             errors.append("Invalid phone number format")
         
         # SSN validation (if provided)
-        if data.get("ssn") and not re.match(self.validation_patterns["ssn"], data["ssn"]):
+        if data.get("ssn") and not self._match_ssn(data["ssn"]):
             errors.append("Invalid SSN format (XXX-XX-XXXX)")
         
         # Date validation
-        if data.get("start_date"):
-            try:
-                start_date = datetime.strptime(data["start_date"], "%Y-%m-%d").date()
-                if start_date < date.today():
-                    errors.append("Start date cannot be in the past")
-            except ValueError:
-                errors.append("Invalid start date format")
-        
-        # Department-Position validation
-        if data.get("department") and data.get("position"):
-            if data["position"] not in self.positions.get(data["department"], []):
-                errors.append("Position is not valid for the selected department")
+        try:
+            start_date = date.fromisoformat(data["start_date"])
+            if start_date < date.today():
+                errors.append("Start date cannot be in the past")
+        except ValueError:
+            errors.append("Invalid start date format")
         
         return errors
     
@@ -100,42 +217,45 @@ class EmployeeDataManager:
         employee_id = self.generate_employee_id()
         
         # Get institution data for integration
-        institution_data = institution_data_manager.get_institution_data()
+        institution_data = _get_cached_institution()
         
         # Create comprehensive employee profile
-        employee_profile = {
-            "employee_id": employee_id,
-            "personal_info": {
-                "first_name": data["first_name"],
-                "last_name": data["last_name"],
-                "email": data["email"],
-                "phone": data["phone"],
-                "address": data.get("address", ""),
-                "date_of_birth": data.get("date_of_birth", ""),
-                "ssn": data.get("ssn", ""),
-                "emergency_contact": data.get("emergency_contact", ""),
-                "emergency_phone": data.get("emergency_phone", "")
-            },
-            "employment_info": {
-                "department": data["department"],
-                "position": data["position"],
-                "employment_type": data["employment_type"],
-                "start_date": data["start_date"],
-                "salary_grade": data.get("salary_grade", ""),
-                "reporting_manager": data.get("reporting_manager", ""),
-                "work_location": data.get("work_location", institution_data["contact_info"]["headquarters"]),
-                "status": "Active"
-            },
-            "system_info": {
-                "created_date": datetime.now().isoformat(),
-                "created_by": "HR System",
-                "last_updated": datetime.now().isoformat(),
-                "institution_id": institution_data["basic_info"]["registration_number"]
-            }
-        }
+        now = datetime.now().isoformat()
+        employee_profile = EmployeeProfile(
+            employee_id=employee_id,
+            personal_info=PersonalInfo(
+                first_name=data["first_name"],
+                last_name=data["last_name"],
+                email=data["email"],
+                phone=data["phone"],
+                address=data.get("address", ""),
+                date_of_birth=data.get("date_of_birth", ""),
+                ssn=data.get("ssn", ""),
+                emergency_contact=data.get("emergency_contact", ""),
+                emergency_phone=data.get("emergency_phone", "")
+            ),
+            employment_info=EmploymentInfo(
+                department=data["department"],
+                position=data["position"],
+                employment_type=data["employment_type"],
+                start_date=data["start_date"],
+                salary_grade=data.get("salary_grade", ""),
+                reporting_manager=data.get("reporting_manager", ""),
+                work_location=data.get("work_location", institution_data["contact_info"]["headquarters"])
+            ),
+            system_info=SystemInfo(
+                created_date=now,
+                last_updated=now,
+                institution_id=institution_data["basic_info"]["registration_number"]
+            )
+        )
         
         # Store employee data
-        self.employees[employee_id] = employee_profile
+        with self._lock:
+            self.employees[employee_id] = employee_profile
+            self._by_department[data["department"]][employee_id] = None
+            self._by_status["Active"][employee_id] = None
+            self._index_employee_search(employee_id, employee_profile)
         
         # Update institution statistics
         self.update_institution_statistics()
@@ -143,27 +263,92 @@ class EmployeeDataManager:
         return True, employee_profile
     
     def update_institution_statistics(self):
-        """Update institution employee count automatically"""
-        new_count = len(self.employees)
-        institution_data_manager.update_section("statistics", {"total_employees": new_count})
+        """Update institution employee count automatically
+        
+        Inside the event loop the write is deferred by STATS_FLUSH_DELAY_SECONDS so a
+        burst of enrollments (e.g. a bulk import) updates the institution only once.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            if core.loop is not None and core.loop.is_running():
+                # Worker thread (offloaded enrollment): schedule the update on the event loop
+                core.loop.call_soon_threadsafe(self.update_institution_statistics)
+            else:
+                # No event loop (scripts, tests): write straight through
+                self._flush_institution_statistics()
+            return
+        if self._stats_dirty:
+            return
+        self._stats_dirty = True
+        loop.call_later(STATS_FLUSH_DELAY_SECONDS, self._flush_institution_statistics)
+    
+    def _flush_institution_statistics(self):
+        """Write the active employee count to the institution statistics"""
+        self._stats_dirty = False
+        # Same figure get_employee_statistics reports, so a late flush agrees with it
+        active_count = len(self._by_status.get("Active", ()))
+        get_institution_data_manager().update_section("statistics", {"total_employees": active_count})
+    
+    def set_employee_status(self, employee_id, status, **details):
+        """Change an employee's employment status, keeping the status index in step
+        
+        Extra keyword arguments (e.g. termination_date) must name EmploymentInfo fields.
+        Returns False when the employee does not exist.
+        """
+        employee = self.employees.get(employee_id)
+        if employee is None:
+            return False
+        employment_info = employee.employment_info
+        with self._lock:
+            self._by_status[employment_info.status].pop(employee_id, None)
+            self._by_status[status][employee_id] = None
+            employment_info.status = status
+            for name, value in details.items():
+                setattr(employment_info, name, value)
+        return True
     
     def get_department_positions(self, department):
         """Get positions for a specific department"""
-        return self.positions.get(department, [])
+        return POSITIONS.get(department, ())
+    
+    @staticmethod
+    def _searchable_text(emp_id, employee):
+        """Lowercased text an employee is matched against"""
+        personal, employment = employee.personal_info, employee.employment_info
+        return f"{personal.first_name} {personal.last_name} {personal.email} {employment.department} {employment.position} {emp_id}".lower()
+    
+    def _index_employee_search(self, emp_id, employee):
+        """Add an employee to the search blobs and the search trie"""
+        self._employee_order[emp_id] = len(self._employee_order)
+        blob = self._search_blobs[emp_id] = self._searchable_text(emp_id, employee)
+        for token in set(_SEARCH_TOKEN_RE.findall(blob)):
+            for start in range(len(token)):
+                node = self._search_trie
+                for char in token[start:]:
+                    node = node.setdefault(char, {})
+                    node.setdefault(None, set()).add(emp_id)
     
     def search_employees(self, query):
-        """Advanced employee search algorithm"""
-        results = []
+        """Advanced employee search algorithm (substring match over the main fields)"""
         query_lower = query.lower()
-        
-        for emp_id, employee in self.employees.items():
-            # Search in multiple fields
-            searchable_text = f"{employee['personal_info']['first_name']} {employee['personal_info']['last_name']} {employee['personal_info']['email']} {employee['employment_info']['department']} {employee['employment_info']['position']} {emp_id}".lower()
+        if not query_lower:
+            return list(self.employees.values())
+        
+        # Held so an enrollment in a worker thread cannot reshape the index mid-walk
+        with self._lock:
+            # A one-word query can only occur inside a single token: walk the suffix trie
+            if _SEARCH_TOKEN_RE.fullmatch(query_lower):
+                node = self._search_trie
+                for char in query_lower:
+                    node = node.get(char)
+                    if node is None:
+                        return []
+                return [self.employees[emp_id] for emp_id in sorted(node[None], key=self._employee_order.__getitem__)]
             
-            if query_lower in searchable_text:
-                results.append(employee)
-        
-        return results
+            # Queries spanning words or punctuation fall back to scanning the search blobs
+            employees = self.employees
+            return [employees[emp_id] for emp_id, blob in self._search_blobs.items() if query_lower in blob]
 
 # Global employee data manager
 employee_data_manager = EmployeeDataManager()
@@ -175,7 +360,9 @@ def EnrollNewStaff():
     """
     
     # Get institution data for integration
-    institution_data = institution_data_manager.get_institution_data()
+    institution_data = _get_cached_institution()
+    basic_info = institution_data["basic_info"]
+    statistics = institution_data["statistics"]
     
     # Page header with modern design
     with ui.row().classes('w-full justify-between items-center mb-8 p-6 bg-gradient-to-r from-blue-600 to-purple-600 rounded-xl shadow-lg'):
@@ -198,13 +385,14 @@ def EnrollNewStaff():
                      on_click=view_employee_directory).props('flat color=white unelevated')
     
     # Institution integration info with modern card design
-    with ui.card().classes('w-full p-6 mb-8 bg-gradient-to-r from-green-50 to-blue-50 border-l-4 border-green-500 shadow-md'):
-        with ui.row().classes('items-center justify-between w-full'):
+    title, stats_line = _banner_labels(basic_info["name"], statistics["total_employees"], statistics["departments"])
+    with ui.card().classes(_BANNER_CLS):
+        with ui.row().classes(_BANNER_ROW_CLS):
             with ui.row().classes('items-center gap-4'):
                 ui.icon('business').classes('text-4xl text-green-600')
                 with ui.column():
-                    ui.label(f'Enrolling to: {institution_data["basic_info"]["name"]}').classes('text-xl font-bold text-gray-800')
-                    ui.label(f'Total Employees: {institution_data["statistics"]["total_employees"]} | Departments: {institution_data["statistics"]["departments"]}').classes('text-sm text-gray-600 font-medium')
+                    ui.label(title).classes(_BANNER_TITLE_CLS)
+                    ui.label(stats_line).classes(_BANNER_STATS_CLS)
             
             with ui.row().classes('gap-3'):
                 ui.chip('Active Institution', icon='check_circle', color='green').props('dense')
@@ -250,8 +438,14 @@ def EnrollNewStaff():
                     validate_btn = ui.button('Validate & Continue', icon='arrow_forward', 
                                             on_click=lambda: validate_personal_info(form_data, first_name, last_name, email, phone, ssn, date_of_birth, gender, address, tabs, employment_tab)).props('color=primary elevation=2')
         
-        # Employment Details Panel
-        with ui.tab_panel(employment_tab):
+        # The remaining panels start empty and are built the first time their tab is shown
+        employment_panel = ui.tab_panel(employment_tab)
+        contact_panel = ui.tab_panel(contact_tab)
+        review_panel = ui.tab_panel(review_tab)
+    
+    # Employment Details Panel
+    def build_employment_panel():
+        with employment_panel:
             with ui.card().classes('w-full p-8 shadow-lg border-l-4 border-green-500'):
                 with ui.row().classes('items-center mb-6'):
                     ui.icon('work').classes('text-3xl text-green-600 mr-3')
@@ -260,20 +454,20 @@ def EnrollNewStaff():
                 with ui.grid(columns=2).classes('gap-8 w-full'):
                     # Left column
                     with ui.column().classes('gap-6'):
-                        department = ui.select(employee_data_manager.departments, 
+                        department = ui.select(list(DEPARTMENTS), 
                                              label='Department *').classes('w-full').props('outlined dense')
                         position = ui.select([], label='Position *').classes('w-full').props('outlined dense')
                         
                         # Dynamic position loading based on department
                         department.on('update:model-value', lambda e: update_positions(position, department.value))
                         
-                        employment_type = ui.select(employee_data_manager.employment_types, 
+                        employment_type = ui.select(list(EMPLOYMENT_TYPES), 
                                                   label='Employment Type *').classes('w-full').props('outlined dense')
                         start_date = ui.date('Start Date *').classes('w-full').props('outlined dense')
                     
                     # Right column
                     with ui.column().classes('gap-6'):
-                        salary_grade = ui.select(employee_data_manager.salary_grades, 
+                        salary_grade = ui.select(list(SALARY_GRADES), 
                                                label='Salary Grade').classes('w-full').props('outlined dense')
                         reporting_manager = ui.input('Reporting Manager', placeholder='Manager name').classes('w-full').props('outlined dense')
                         work_location = ui.input('Work Location', placeholder='Office location').classes('w-full').props('outlined dense')
@@ -281,7 +475,7 @@ def EnrollNewStaff():
                         # Employee ID preview with modern design
                         with ui.card().classes('p-4 bg-gradient-to-r from-blue-50 to-indigo-50 border border-blue-200'):
                             ui.label('Employee ID (Auto-generated)').classes('text-sm text-gray-600 font-medium')
-                            ui.label(employee_data_manager.generate_employee_id()).classes('text-xl font-mono font-bold text-blue-600')
+                            ui.label(employee_data_manager.peek_next_employee_id()).classes('text-xl font-mono font-bold text-blue-600')
                 
                 # Navigation with modern buttons
                 with ui.row().classes('justify-between mt-8'):
@@ -289,9 +483,10 @@ def EnrollNewStaff():
                              on_click=lambda: tabs.set_value(tabs.tabs[0])).props('outlined elevation=1')
                     ui.button('Continue', icon='arrow_forward', 
                              on_click=lambda: save_employment_details(form_data, department, position, employment_type, start_date, salary_grade, reporting_manager, work_location, tabs, contact_tab)).props('color=primary elevation=2')
-        
-        # Contact & Emergency Panel
-        with ui.tab_panel(contact_tab):
+    
+    # Contact & Emergency Panel
+    def build_contact_panel():
+        with contact_panel:
             with ui.card().classes('w-full p-8 shadow-lg border-l-4 border-purple-500'):
                 with ui.row().classes('items-center mb-6'):
                     ui.icon('contact_phone').classes('text-3xl text-purple-600 mr-3')
@@ -326,9 +521,10 @@ def EnrollNewStaff():
                              on_click=lambda: tabs.set_value(tabs.tabs[1])).props('outlined elevation=1')
                     ui.button('Continue to Review', icon='arrow_forward', 
                              on_click=lambda: save_contact_info(form_data, emergency_name, emergency_relationship, emergency_phone, emergency_email, preferred_name, tabs, review_tab)).props('color=primary elevation=2')
-        
-        # Review & Submit Panel
-        with ui.tab_panel(review_tab):
+    
+    # Review & Submit Panel
+    def build_review_panel():
+        with review_panel:
             with ui.card().classes('w-full p-8 shadow-lg border-l-4 border-orange-500'):
                 with ui.row().classes('items-center mb-6'):
                     ui.icon('check_circle').classes('text-3xl text-orange-600 mr-3')
@@ -347,9 +543,26 @@ def EnrollNewStaff():
                     
                     ui.button('Enroll Employee', icon='person_add', 
                              on_click=lambda: submit_enrollment(form_data, review_container)).props('color=success size=lg elevation=2')
+    
+    pending_panels = {
+        employment_tab: build_employment_panel,
+        contact_tab: build_contact_panel,
+        review_tab: build_review_panel
+    }
+    tabs.on_value_change(lambda e: build_pending_panel(pending_panels, e.value))
 
 # Helper functions for form handling
 
+def build_pending_panel(pending_panels, value):
+    """Build a lazily created tab panel on its first show
+    
+    The tabs value is the ui.tab after tabs.set_value() and the tab name after a click.
+    """
+    for tab in pending_panels:
+        if tab is value or tab.props['name'] == value:
+            pending_panels.pop(tab)()
+            return
+
 def create_personal_info_section(form_data, tabs, next_tab):
     """Create personal information form section"""
     with ui.card().classes('w-full p-6'):
@@ -388,21 +601,21 @@ def create_employment_details_section(form_data, tabs, next_tab):
         with ui.grid(columns=2).classes('gap-6 w-full'):
             # Left column
             with ui.column().classes('gap-4'):
-                department = ui.select(employee_data_manager.departments, 
+                department = ui.select(list(DEPARTMENTS), 
                                      label='Department *').classes('w-full').props('outlined dense')
                 position = ui.select([], label='Position *').classes('w-full').props('outlined dense')
                 
                 # Dynamic position loading based on department
                 department.on('update:model-value', lambda e: update_positions(position, e.value))
                 
-                employment_type = ui.select(employee_data_manager.employment_types, 
+                employment_type = ui.select(list(EMPLOYMENT_TYPES), 
                                           label='Employment Type *').classes('w-full').props('outlined dense')
                 
                 start_date = ui.date('Start Date *').classes('w-full').props('outlined dense')
             
             # Right column
             with ui.column().classes('gap-4'):
-                salary_grade = ui.select(employee_data_manager.salary_grades, 
+                salary_grade = ui.select(list(SALARY_GRADES), 
                                        label='Salary Grade').classes('w-full').props('outlined dense')
                 reporting_manager = ui.input('Reporting Manager', placeholder='Manager name').classes('w-full').props('outlined dense')
                 work_location = ui.input('Work Location', placeholder='Office location').classes('w-full').props('outlined dense')
@@ -410,7 +623,7 @@ def create_employment_details_section(form_data, tabs, next_tab):
                 # Employee ID preview
                 with ui.card().classes('p-3 bg-gray-50'):
                     ui.label('Employee ID (Auto-generated)').classes('text-sm text-gray-600')
-                    ui.label(employee_data_manager.generate_employee_id()).classes('text-lg font-mono font-bold text-blue-600')
+                    ui.label(employee_data_manager.peek_next_employee_id()).classes('text-lg font-mono font-bold text-blue-600')
         
         # Navigation
         with ui.row().classes('justify-between mt-6'):
@@ -494,7 +707,7 @@ def validate_personal_info(form_data, first_name, last_name, email, phone, ssn,
         errors.append("Last name is required")
     if not email.value:
         errors.append("Email is required")
-    elif not emailValidation(email.value):
+    elif not employee_data_manager.is_valid_email(email.value):
         errors.append("Invalid email format")
     if not phone.value:
         errors.append("Phone number is required")
@@ -510,7 +723,7 @@ def update_positions(position_select, department_value):
     """Update position options based on selected department"""
     if department_value:
         positions = employee_data_manager.get_department_positions(department_value)
-        position_select.set_options(positions)
+        position_select.set_options(list(positions))
         position_select.set_value(None)
 
 def save_employment_details(form_data, department, position, employment_type, start_date, salary_grade, reporting_manager, work_location, tabs, next_tab):
@@ -562,7 +775,7 @@ async def update_global_statistics():
         stats = employee_data_manager.get_employee_statistics()
         
         # Update institution statistics
-        institution_data_manager.update_section("statistics", {
+        get_institution_data_manager().update_section("statistics", {
             "total_employees": stats["total_employees"],
             "last_updated": datetime.now().isoformat()
         })
@@ -584,7 +797,7 @@ def update_global_statistics_sync():
         stats = get_employee_statistics()
         
         # Update institution statistics
-        institution_data_manager.update_section("statistics", {
+        get_institution_data_manager().update_section("statistics", {
             "total_employees": stats["total_employees"],
             "last_updated": datetime.now().isoformat()
         })
@@ -603,49 +816,16 @@ def update_global_statistics_sync():
         print(f"Error updating global statistics: {e}")
         ui.notify('Statistics update completed with minor issues', color='warning')
 
-def submit_enrollment(form_data, review_container):
-    """Submit the employee enrollment"""
-    ui.notify('Processing employee enrollment...', color='info')
-    
-    # Create employee profile
-    success, result = employee_data_manager.create_employee_profile(form_data)
-    
-    if success:
-        employee_profile = result
-        ui.notify(f'Employee enrolled successfully! ID: {employee_profile["employee_id"]}', color='positive')
-        
-        # Trigger real-time statistics update across the application
-        update_global_statistics_sync()
-        
-        # Show success dialog
-        with ui.dialog() as dialog, ui.card():
-            ui.label('Employee Enrollment Successful!').classes('text-xl font-bold text-green-600')
-            ui.separator()
-            ui.label(f'Employee ID: {employee_profile["employee_id"]}').classes('text-lg font-mono')
-            ui.label(f'Name: {employee_profile["personal_info"]["first_name"]} {employee_profile["personal_info"]["last_name"]}').classes('text-lg')
-            ui.label(f'Department: {employee_profile["employment_info"]["department"]}').classes('text-lg')
-            ui.label(f'Position: {employee_profile["employment_info"]["position"]}').classes('text-lg')
-            
-            with ui.row().classes('gap-2 mt-4'):
-                ui.button('Print Profile', icon='print').props('color=blue')
-                ui.button('Send Welcome Email', icon='email').props('color=green')
-                ui.button('Close', on_click=dialog.close).props('color=primary')
-        
-        dialog.open()
-    else:
-        errors = result
-        ui.notify(f'Enrollment failed: {", ".join(errors)}', color='negative')
-
-def submit_enrollment(form_data, review_container):
+async def submit_enrollment(form_data, review_container):
     """Submit the employee enrollment"""
     ui.notify('Processing employee enrollment...', color='info')
     
-    # Create employee profile
-    success, result = employee_data_manager.create_employee_profile(form_data)
+    # Create employee profile off the event loop so other clients stay responsive
+    success, result = await asyncio.to_thread(employee_data_manager.create_employee_profile, form_data)
     
     if success:
         employee_profile = result
-        ui.notify(f'Employee enrolled successfully! ID: {employee_profile["employee_id"]}', color='positive')
+        ui.notify(f'Employee enrolled successfully! ID: {employee_profile.employee_id}', color='positive')
         
         # Trigger real-time statistics update across the application
         update_global_statistics_sync()
@@ -654,10 +834,10 @@ def submit_enrollment(form_data, review_container):
         with ui.dialog() as dialog, ui.card():
             ui.label('Employee Enrollment Successful!').classes('text-xl font-bold text-green-600')
             ui.separator()
-            ui.label(f'Employee ID: {employee_profile["employee_id"]}').classes('text-lg font-mono')
-            ui.label(f'Name: {employee_profile["personal_info"]["first_name"]} {employee_profile["personal_info"]["last_name"]}').classes('text-lg')
-            ui.label(f'Department: {employee_profile["employment_info"]["department"]}').classes('text-lg')
-            ui.label(f'Position: {employee_profile["employment_info"]["position"]}').classes('text-lg')
+            ui.label(f'Employee ID: {employee_profile.employee_id}').classes('text-lg font-mono')
+            ui.label(f'Name: {employee_profile.personal_info.first_name} {employee_profile.personal_info.last_name}').classes('text-lg')
+            ui.label(f'Department: {employee_profile.employment_info.department}').classes('text-lg')
+            ui.label(f'Position: {employee_profile.employment_info.position}').classes('text-lg')
             
             with ui.row().classes('gap-2 mt-4'):
                 ui.button('Print Profile', icon='print').props('color=blue')
@@ -691,16 +871,14 @@ def get_employee_data(employee_id):
 
 def get_department_employees(department):
     """API to get all employees in a department"""
-    return [emp for emp in employee_data_manager.employees.values() 
-            if emp['employment_info']['department'] == department]
+    employees = employee_data_manager.employees
+    return [employees[emp_id] for emp_id in employee_data_manager._by_department.get(department, ())]
 
 def get_employee_statistics():
     """API to get employee statistics for dashboard"""
-    total_employees = len([emp for emp in employee_data_manager.employees.values()
-                          if emp['employment_info']['status'] == 'Active'])
-    departments = employee_data_manager.departments
-    active_employees = len([emp for emp in employee_data_manager.employees.values() 
-                           if emp['employment_info']['status'] == 'Active'])
+    active_employees = len(employee_data_manager._by_status.get('Active', ()))
+    total_employees = active_employees
+    departments = DEPARTMENTS
     
     return {
         'total_employees': total_employees,
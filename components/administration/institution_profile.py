@@ -3,7 +3,189 @@ from helperFuns import imagePath
 from assets import FlipCards, SearchBox
 import asyncio
 from datetime import datetime
-import json
+import logging
+import os
+import re
+import threading
+import time
+from types import MappingProxyType
+from dataclasses import dataclass
+from functools import lru_cache
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# Set HRM_DEMO_MODE=1 to keep the simulated one-second export/save delays
+DEMO_MODE = os.getenv('HRM_DEMO_MODE', '0') == '1'
+
+# Option lists for the profile cards (read-only; ui.select needs list copies of these)
+_INDUSTRIES = ('Technology Services', 'Healthcare', 'Finance', 'Education', 'Manufacturing', 'Retail', 'Consulting')
+_COMPANY_SIZES = ('1-10', '11-50', '51-200', '201-500', '500+')
+_STATUSES = ('Active', 'Inactive', 'Suspended')
+_MONTHS = ('January', 'February', 'March', 'April', 'May', 'June',
+           'July', 'August', 'September', 'October', 'November', 'December')
+_CURRENCIES = ('USD', 'EUR', 'GBP', 'JPY', 'CAD', 'AUD')
+_TIMEZONES = ('America/New_York', 'America/Los_Angeles', 'Europe/London', 'Europe/Berlin', 'Asia/Tokyo', 'Asia/Shanghai', 'Australia/Sydney')
+_DAYS = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+# (label, value, icon) triples in the hero's key metrics row
+_HERO_METRICS = (
+    ('Founded', '2011', '🎯'),
+    ('Employees', '142', '👥'),
+    ('Departments', '8', '🏗️'),
+    ('Status', 'Active', '✅')
+)
+# Each metric as one html fragment (icon, value, label), built at import
+_HERO_METRICS_HTML = tuple(
+    f'<div class="text-center"><div class="text-2xl mb-1">{icon}</div>'
+    f'<div class="text-2xl font-bold">{value}</div>'
+    f'<div class="text-sm text-blue-100">{label}</div></div>'
+    for label, value, icon in _HERO_METRICS
+)
+
+def working_days_mask(days):
+    """Pack weekday names into a 7-bit mask; bit 0 is Monday, matching date.weekday()"""
+    mask = 0
+    for day in days:
+        mask |= 1 << _DAYS.index(day)
+    return mask
+
+def is_working_day(mask, weekday):
+    """Whether weekday (0 = Monday, as from date.weekday()) is set in a working_days_mask"""
+    return bool(mask >> weekday & 1)
+
+# Working-day tile classes and short day labels, indexed by whether the day is checked
+_DAY_TILE_CLS = (
+    'flex items-center p-3 rounded-xl border-2 transition-all duration-200 cursor-pointer hover:shadow-md border-gray-200 hover:border-purple-300',
+    'flex items-center p-3 rounded-xl border-2 transition-all duration-200 cursor-pointer hover:shadow-md border-purple-500 bg-purple-50'
+)
+_DAY_LABEL_HTML = {
+    (day, checked): f'<span class="text-sm font-medium {"text-purple-700" if checked else "text-gray-600"}">{day[:3]}</span>'
+    for day in _DAYS for checked in (False, True)
+}
+# (label, value) pairs shown under Business Rules
+_BUSINESS_RULES = (
+    ('Overtime Policy', '1.5x after 40 hours'),
+    ('Leave Accrual', '10 days per year'),
+    ('Remote Work', 'Hybrid model allowed')
+)
+
+# Tailwind class strings shared by the profile cards
+_INPUT_CLS = 'w-full px-4 py-3 border border-gray-300 rounded-xl focus:ring-2 focus:ring-{accent}-500 focus:border-transparent transition-all duration-200 hover:border-{accent}-400'
+_INPUT_BLUE = _INPUT_CLS.format(accent='blue')
+_INPUT_EMERALD = _INPUT_CLS.format(accent='emerald')
+_INPUT_PURPLE = _INPUT_CLS.format(accent='purple')
+_INPUT_CLASSES = {'blue': _INPUT_BLUE, 'emerald': _INPUT_EMERALD, 'purple': _INPUT_PURPLE}
+_STAT_CARD_CLS = 'group relative overflow-hidden bg-gradient-to-br {gradient} rounded-2xl p-6 text-white shadow-xl hover:shadow-2xl transition-all duration-300 transform hover:scale-105 cursor-pointer'
+_STAT_CARD_BLUE = _STAT_CARD_CLS.format(gradient='from-blue-500 to-blue-600')
+_STAT_CARD_EMERALD = _STAT_CARD_CLS.format(gradient='from-emerald-500 to-green-600')
+_STAT_CARD_PURPLE = _STAT_CARD_CLS.format(gradient='from-purple-500 to-indigo-600')
+_STAT_CARD_ORANGE = _STAT_CARD_CLS.format(gradient='from-orange-500 to-red-500')
+_STAT_CARD_BUBBLE = 'absolute top-0 right-0 w-20 h-20 bg-white bg-opacity-10 rounded-full -mr-10 -mt-10'
+_CARD_SHELL = 'bg-white rounded-2xl shadow-xl border border-gray-100 overflow-hidden hover:shadow-2xl transition-all duration-300'
+_ACTION_BAR = 'flex justify-end gap-3 mt-6 pt-6 border-t border-gray-100'
+_BTN_GHOST = 'bg-gray-100 text-gray-700 px-6 py-3 rounded-xl hover:bg-gray-200 font-semibold transition-all duration-300'
+
+@dataclass(frozen=True, slots=True)
+class _ModuleRow:
+    """An HR module shown in the System Integration card"""
+    name: str
+    status: str
+    icon: str
+    color: str
+    description: str
+
+_HR_MODULES = (
+    _ModuleRow('Employee Management', 'Connected', '👥', 'emerald', 'Staff directory & profiles'),
+    _ModuleRow('Department Management', 'Connected', '🏢', 'emerald', 'Organizational structure'),
+    _ModuleRow('Attendance Tracking', 'Connected', '⏰', 'emerald', 'Time & attendance'),
+    _ModuleRow('Payroll System', 'Pending', '💰', 'orange', 'Salary & compensation'),
+    _ModuleRow('Performance Reviews', 'Not Connected', '⭐', 'red', 'Employee evaluations'),
+    _ModuleRow('Recruitment', 'Not Connected', '🎯', 'red', 'Hiring & onboarding')
+)
+
+# (button label, route, button classes) for the integration card's quick actions
+_QUICK_ACTIONS = tuple(
+    (f'{icon} {name}', route, f'w-full bg-{color}-600 text-white p-4 rounded-xl hover:bg-{color}-700 font-semibold shadow-lg hover:shadow-xl transition-all duration-300 text-left')
+    for name, icon, route, color in (
+        ('Create Department', '🏗️', '/administration/departments', 'blue'),
+        ('Add Employee', '👤', '/administration/enroll-staff', 'green'),
+        ('View Reports', '📊', '/reports/dashboard', 'purple'),
+        ('System Settings', '⚙️', '/administration/settings', 'gray')
+    )
+)
+
+_MODULE_ROW_CLS = 'flex items-center justify-between p-4 rounded-xl border-2 transition-all duration-200 hover:shadow-md'
+
+def _module_info_html(module):
+    """Icon, name and description of an integration module row"""
+    return (f'<div class="flex items-center gap-4"><div class="text-2xl">{module.icon}</div>'
+            f'<div class="flex flex-col gap-1 flex-1"><div class="font-semibold text-gray-800">{module.name}</div>'
+            f'<div class="text-sm text-gray-600">{module.description}</div></div></div>')
+
+def _module_badge_html(module):
+    """Status pill for a Connected or Pending module"""
+    if module.status == "Connected":
+        return f'<div class="inline-flex items-center px-3 py-1 rounded-full text-xs font-medium bg-{module.color}-100 text-{module.color}-800"><div class="w-2 h-2 bg-{module.color}-500 rounded-full mr-2"></div>Connected</div>'
+    return '<div class="inline-flex items-center px-3 py-1 rounded-full text-xs font-medium bg-orange-100 text-orange-800"><div class="w-2 h-2 bg-orange-500 rounded-full mr-2 animate-pulse"></div>Pending</div>'
+
+def _build_module_blocks(modules):
+    """Join consecutive static module rows into one HTML string; keep Not Connected rows as modules"""
+    blocks, run = [], []
+    for module in modules:
+        if module.status in ("Connected", "Pending"):
+            border = f"border-{module.color}-200 bg-{module.color}-50" if module.status == "Connected" else "border-gray-200"
+            run.append(f'<div class="{_MODULE_ROW_CLS} {border}"><div class="flex-1">{_module_info_html(module)}</div>'
+                       f'<div class="text-right">{_module_badge_html(module)}</div></div>')
+            continue
+        if run:
+            blocks.append(f'<div class="space-y-3">{"".join(run)}</div>')
+            run = []
+        blocks.append(module)
+    if run:
+        blocks.append(f'<div class="space-y-3">{"".join(run)}</div>')
+    return tuple(blocks)
+
+_HR_MODULE_BLOCKS = _build_module_blocks(_HR_MODULES)
+
+# Connect button classes for each module colour
+_CONNECT_BTN_CLS = {
+    color: f'bg-{color}-600 text-white px-4 py-2 rounded-lg hover:bg-{color}-700 text-sm font-medium transition-all duration-300'
+    for color in {module.color for module in _HR_MODULES}
+}
+
+# Hero background grid pattern
+_HERO_GRID_SVG = '<div class="absolute inset-0 opacity-10"><svg width="100%" height="100%"><defs><pattern id="grid" width="40" height="40" patternUnits="userSpaceOnUse"><path d="M 40 0 L 0 0 0 40" fill="none" stroke="white" stroke-width="1"/></pattern></defs><rect width="100%" height="100%" fill="url(#grid)"/></svg></div>'
+
+# Statistics overview cards, in display order
+# The icon, label and subtitle markup never changes, so it is formatted once here
+_STAT_CARDS = tuple(
+    {
+        'key': key,
+        'card_cls': card_cls,
+        'icon_html': f'<div class="text-3xl">{icon}</div>',
+        'label_html': f'<div class="text-{accent}-200 text-sm font-medium">{label}</div>',
+        'subtitle_html': f'<div class="text-{accent}-100 text-sm">{subtitle}</div>'
+    }
+    for key, icon, label, card_cls, accent, subtitle in (
+        ('total_employees', '👥', 'Employees', _STAT_CARD_BLUE, 'blue', '↗️ +12% this quarter'),
+        ('departments', '🏗️', 'Departments', _STAT_CARD_EMERALD, 'emerald', 'All active'),
+        ('locations', '📍', 'Locations', _STAT_CARD_PURPLE, 'purple', 'Multi-site'),
+        ('active_projects', '🚀', 'Projects', _STAT_CARD_ORANGE, 'orange', 'In progress')
+    )
+)
+
+# Employee statistics are reused for this long unless the institution data changes first
+STATS_TTL_SECONDS = 5
+
+@lru_cache(maxsize=1)
+def _fetch_stats_cached(version, bucket):
+    """Employee statistics for one (data version, time bucket) pair
+    
+    enroll_staff imports this module at load time, so the import stays inside the function;
+    the cache means it only runs once per bucket.
+    """
+    from components.administration.enroll_staff import get_employee_statistics
+    return get_employee_statistics()
 
 # Data management algorithms and state
 class InstitutionDataManager:
@@ -12,6 +194,23 @@ class InstitutionDataManager:
     validation, and inter-module communication algorithms
     """
     
+    # Validation patterns, compiled once and shared by every instance
+    _EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+    _PHONE_RE = re.compile(r'^\+?1?\d{9,15}$')
+    # Formatting dropped from a phone number before it is matched, e.g. "+1 (555) 123-4567"
+    _PHONE_FORMATTING = str.maketrans('', '', ' ()-.')
+    
+    # Field rules are the same for every instance, so they live on the class
+    validation_rules = {
+        "name": {"required": True, "min_length": 2, "max_length": 100},
+        "email": {"required": True, "pattern": _EMAIL_RE},
+        "phone": {"required": True, "pattern": _PHONE_RE, "strip": _PHONE_FORMATTING},
+        "registration_number": {"required": True, "min_length": 5}
+    }
+    
+    # Fixed attribute set; no per-instance __dict__
+    __slots__ = ('institution_data', '_read_only_view', 'version', '_ts_cache', '_metrics_cache')
+    
     def __init__(self):
         self.institution_data = {
             "basic_info": {
@@ -46,29 +245,44 @@ class InstitutionDataManager:
                 "last_updated": datetime.now().isoformat()
             }
         }
-        self.validation_rules = {
-            "name": {"required": True, "min_length": 2, "max_length": 100},
-            "email": {"required": True, "pattern": r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'},
-            "phone": {"required": True, "pattern": r'^\+?1?\d{9,15}$'},
-            "registration_number": {"required": True, "min_length": 5}
-        }
+        # Read-only views handed out by get_institution_data. They are live views of the
+        # section dicts, so they track every update without being rebuilt or copied.
+        self._read_only_view = MappingProxyType({
+            section: MappingProxyType(values) for section, values in self.institution_data.items()
+        })
+        # Bumped on every successful update so readers can tell when cached data is stale
+        self.version = 0
+        # (monotonic time, ISO timestamp) of the last formatted "now"
+        self._ts_cache = (float('-inf'), '')
+        # (version, metrics view) of the last get_dashboard_metrics result
+        self._metrics_cache = (-1, None)
+    
+    def _timestamp(self):
+        """Current time as an ISO string, formatted at most once per second"""
+        now = time.monotonic()
+        if now - self._ts_cache[0] >= 1.0:
+            self._ts_cache = (now, datetime.now().isoformat())
+        return self._ts_cache[1]
+    
+    def mark_updated(self):
+        """Stamp the statistics' last_updated time without changing any other data"""
+        self.institution_data["statistics"]["last_updated"] = self._timestamp()
     
     def get_institution_data(self):
-        """Retrieve current institution data with dynamic statistics"""
+        """Retrieve current institution data with dynamic statistics (read-only view; use update_section to change it)"""
         # Get current employee statistics
         try:
-            from components.administration.enroll_staff import get_employee_statistics
-            current_stats = get_employee_statistics()
+            current_stats = _fetch_stats_cached(self.version, int(time.time() // STATS_TTL_SECONDS))
             
             # Update the statistics section with current data
             self.institution_data["statistics"].update({
                 "total_employees": current_stats["total_employees"],
-                "last_updated": datetime.now().isoformat()
+                "last_updated": self._timestamp()
             })
         except Exception as e:
             print(f"Warning: Could not get current employee statistics: {e}")
         
-        return self.institution_data
+        return self._read_only_view
     
     def update_section(self, section, data):
         """Update specific section with validation"""
@@ -76,7 +290,8 @@ class InstitutionDataManager:
             # Validate data before updating
             if self.validate_data(section, data):
                 self.institution_data[section].update(data)
-                self.institution_data["statistics"]["last_updated"] = datetime.now().isoformat()
+                self.institution_data["statistics"]["last_updated"] = self._timestamp()
+                self.version += 1
                 return True, "Data updated successfully"
             else:
                 return False, "Validation failed"
@@ -84,40 +299,74 @@ class InstitutionDataManager:
     
     def validate_data(self, section, data):
         """Advanced validation algorithm"""
-        # Implement validation logic based on rules
+        validation_rules = self.validation_rules
         for field, value in data.items():
-            if field in self.validation_rules:
-                rules = self.validation_rules[field]
-                if rules.get("required") and not value:
-                    return False
-                if "min_length" in rules and len(str(value)) < rules["min_length"]:
-                    return False
-                if "max_length" in rules and len(str(value)) > rules["max_length"]:
+            rules = validation_rules.get(field)
+            if rules is None:
+                continue
+            if rules.get("required") and not value:
+                return False
+            text = value if isinstance(value, str) else str(value)
+            length = len(text)
+            if length < rules.get("min_length", 0) or length > rules.get("max_length", length):
+                return False
+            pattern = rules.get("pattern")
+            if pattern is not None:
+                if "strip" in rules:
+                    text = text.translate(rules["strip"])
+                # Compiled once on the class, so this is a plain match call
+                if not pattern.match(text):
                     return False
         return True
     
     def get_dashboard_metrics(self):
-        """Calculate key metrics for dashboard integration"""
-        return {
-            "employee_growth": "+12%",
-            "departments_active": self.institution_data["statistics"]["departments"],
-            "system_health": "Excellent",
-            "last_backup": "2 hours ago"
-        }
-
-# Global data manager instance
-data_manager = InstitutionDataManager()
+        """Calculate key metrics for dashboard integration (read-only, rebuilt only after an update)"""
+        version, metrics = self._metrics_cache
+        if version != self.version:
+            metrics = MappingProxyType({
+                "employee_growth": "+12%",
+                "departments_active": self.institution_data["statistics"]["departments"],
+                "system_health": "Excellent",
+                "last_backup": "2 hours ago"
+            })
+            self._metrics_cache = (self.version, metrics)
+        return metrics
+    
+    def get_working_days_mask(self):
+        """Working days as a bitmask for fast per-date checks (see is_working_day)"""
+        return working_days_mask(self.institution_data["business_info"]["working_days"])
+
+# Global data manager instance, created on first use so importing this module stays cheap
+_data_manager = None
+_data_manager_lock = threading.Lock()
+
+def get_data_manager():
+    """The shared InstitutionDataManager (enrollments may ask for it from worker threads)"""
+    global _data_manager
+    if _data_manager is None:
+        with _data_manager_lock:
+            if _data_manager is None:
+                _data_manager = InstitutionDataManager()
+    return _data_manager
+
+def __getattr__(name):
+    """Keep `data_manager` importable for existing callers without creating it at import time"""
+    if name == "data_manager":
+        return get_data_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def InstitutionProfile():
     """
     Modern Institution Profile page with advanced UI/UX design and integration algorithms
     """
+    # One snapshot shared by every card in this render
+    snapshot = get_data_manager().get_institution_data()
 
     # Modern Hero Section with Company Branding
     with ui.element('div').classes('relative overflow-hidden bg-gradient-to-br from-blue-600 via-indigo-600 to-purple-700 rounded-2xl mb-8 shadow-2xl'):
         with ui.element('div').classes('absolute inset-0 bg-black bg-opacity-20'):
             # Background pattern
-            ui.html('<div class="absolute inset-0 opacity-10"><svg width="100%" height="100%"><defs><pattern id="grid" width="40" height="40" patternUnits="userSpaceOnUse"><path d="M 40 0 L 0 0 0 40" fill="none" stroke="white" stroke-width="1"/></pattern></defs><rect width="100%" height="100%" fill="url(#grid)"/></svg></div>', sanitize=False)
+            ui.html(_HERO_GRID_SVG, sanitize=False)
 
         with ui.element('div').classes('relative z-10 p-8 text-white'):
             with ui.row().classes('justify-between items-start'):
@@ -131,17 +380,8 @@ def InstitutionProfile():
 
                     # Key Metrics Row
                     with ui.row().classes('gap-6 mt-6'):
-                        metrics = [
-                            {'label': 'Founded', 'value': '2011', 'icon': '🎯'},
-                            {'label': 'Employees', 'value': '142', 'icon': '👥'},
-                            {'label': 'Departments', 'value': '8', 'icon': '🏗️'},
-                            {'label': 'Status', 'value': 'Active', 'icon': '✅'}
-                        ]
-                        for metric in metrics:
-                            with ui.element('div').classes('text-center'):
-                                ui.html(f'<div class="text-2xl mb-1">{metric["icon"]}</div>', sanitize=False)
-                                ui.html(f'<div class="text-2xl font-bold">{metric["value"]}</div>', sanitize=False)
-                                ui.html(f'<div class="text-sm text-blue-100">{metric["label"]}</div>', sanitize=False)
+                        for metric_html in _HERO_METRICS_HTML:
+                            ui.html(metric_html, sanitize=False)
 
                 # Action Buttons
                 with ui.column().classes('gap-3'):
@@ -150,84 +390,67 @@ def InstitutionProfile():
                     ui.button('🔧 Settings', icon='settings').classes('bg-transparent text-white border-2 border-white hover:bg-white hover:text-blue-600 font-semibold px-6 py-3 rounded-xl transition-all duration-300')
 
     # Modern Stats Overview Cards
-    create_modern_stats_overview()
+    create_modern_stats_overview(snapshot["statistics"])
 
     # Main Content with Modern Card Layout
     with ui.element('div').classes('grid grid-cols-1 lg:grid-cols-3 gap-8'):
 
         # Primary Information Card (Spans 2 columns)
         with ui.element('div').classes('lg:col-span-2 space-y-6'):
-            create_modern_basic_info_card()
-            create_modern_contact_card()
+            create_modern_basic_info_card(snapshot["basic_info"])
+            create_modern_contact_card(snapshot["contact_info"])
 
-        # Secondary Information Card (Spans 1 column)
-        with ui.element('div').classes('space-y-6'):
-            create_modern_business_settings_card()
-            create_modern_integration_card()
+        # Secondary Information Card (Spans 1 column), filled in once the first payload is on screen
+        with ui.element('div').classes('space-y-6') as secondary_column:
+            ui.timer(0.01, lambda: _build_secondary_cards(secondary_column, snapshot), once=True)
 
-def create_modern_stats_overview():
-    """Create modern statistics overview cards with enhanced visual design"""
-    data = data_manager.get_institution_data()
-    stats = data["statistics"]
+def _build_secondary_cards(container, snapshot):
+    """Build the business settings and integration cards into the secondary column"""
+    with container:
+        create_modern_business_settings_card(snapshot["business_info"])
+        create_modern_integration_card()
 
+def create_modern_stats_overview(stats):
+    """Create modern statistics overview cards with enhanced visual design"""
     with ui.element('div').classes('grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-6 mb-8'):
-
-        # Total Employees Card
-        with ui.element('div').classes('group relative overflow-hidden bg-gradient-to-br from-blue-500 to-blue-600 rounded-2xl p-6 text-white shadow-xl hover:shadow-2xl transition-all duration-300 transform hover:scale-105 cursor-pointer'):
-            with ui.element('div').classes('absolute top-0 right-0 w-20 h-20 bg-white bg-opacity-10 rounded-full -mr-10 -mt-10'):
-                pass
-            with ui.element('div').classes('relative z-10'):
-                with ui.row().classes('justify-between items-start mb-4'):
-                    ui.html('<div class="text-3xl">👥</div>', sanitize=False)
-                    ui.html('<div class="text-blue-200 text-sm font-medium">Employees</div>', sanitize=False)
-                ui.html(f'<div class="text-4xl font-bold mb-2">{stats["total_employees"]}</div>', sanitize=False)
-                ui.html('<div class="text-blue-100 text-sm">↗️ +12% this quarter</div>', sanitize=False)
-
-        # Departments Card
-        with ui.element('div').classes('group relative overflow-hidden bg-gradient-to-br from-emerald-500 to-green-600 rounded-2xl p-6 text-white shadow-xl hover:shadow-2xl transition-all duration-300 transform hover:scale-105 cursor-pointer'):
-            with ui.element('div').classes('absolute top-0 right-0 w-20 h-20 bg-white bg-opacity-10 rounded-full -mr-10 -mt-10'):
-                pass
-            with ui.element('div').classes('relative z-10'):
-                with ui.row().classes('justify-between items-start mb-4'):
-                    ui.html('<div class="text-3xl">🏗️</div>', sanitize=False)
-                    ui.html('<div class="text-emerald-200 text-sm font-medium">Departments</div>', sanitize=False)
-                ui.html(f'<div class="text-4xl font-bold mb-2">{stats["departments"]}</div>', sanitize=False)
-                ui.html('<div class="text-emerald-100 text-sm">All active</div>', sanitize=False)
-
-        # Locations Card
-        with ui.element('div').classes('group relative overflow-hidden bg-gradient-to-br from-purple-500 to-indigo-600 rounded-2xl p-6 text-white shadow-xl hover:shadow-2xl transition-all duration-300 transform hover:scale-105 cursor-pointer'):
-            with ui.element('div').classes('absolute top-0 right-0 w-20 h-20 bg-white bg-opacity-10 rounded-full -mr-10 -mt-10'):
-                pass
-            with ui.element('div').classes('relative z-10'):
-                with ui.row().classes('justify-between items-start mb-4'):
-                    ui.html('<div class="text-3xl">📍</div>', sanitize=False)
-                    ui.html('<div class="text-purple-200 text-sm font-medium">Locations</div>', sanitize=False)
-                ui.html(f'<div class="text-4xl font-bold mb-2">{stats["locations"]}</div>', sanitize=False)
-                ui.html('<div class="text-purple-100 text-sm">Multi-site</div>', sanitize=False)
-
-        # Active Projects Card
-        with ui.element('div').classes('group relative overflow-hidden bg-gradient-to-br from-orange-500 to-red-500 rounded-2xl p-6 text-white shadow-xl hover:shadow-2xl transition-all duration-300 transform hover:scale-105 cursor-pointer'):
-            with ui.element('div').classes('absolute top-0 right-0 w-20 h-20 bg-white bg-opacity-10 rounded-full -mr-10 -mt-10'):
-                pass
-            with ui.element('div').classes('relative z-10'):
-                with ui.row().classes('justify-between items-start mb-4'):
-                    ui.html('<div class="text-3xl">🚀</div>', sanitize=False)
-                    ui.html('<div class="text-orange-200 text-sm font-medium">Projects</div>', sanitize=False)
-                ui.html(f'<div class="text-4xl font-bold mb-2">{stats["active_projects"]}</div>', sanitize=False)
-                ui.html('<div class="text-orange-100 text-sm">In progress</div>', sanitize=False)
-
-def create_modern_basic_info_card():
+        for cfg in _STAT_CARDS:
+            _render_stat_card(stats[cfg['key']], cfg)
+
+def _render_stat_card(value, cfg):
+    """One gradient statistics card; cfg is an entry of _STAT_CARDS"""
+    with ui.element('div').classes(cfg['card_cls']):
+        ui.element('div').classes(_STAT_CARD_BUBBLE)  # corner circle
+        with ui.element('div').classes('relative z-10'):
+            with ui.row().classes('justify-between items-start mb-4'):
+                ui.html(cfg['icon_html'], sanitize=False)
+                ui.html(cfg['label_html'], sanitize=False)
+            ui.html(f'<div class="text-4xl font-bold mb-2">{value}</div>', sanitize=False)
+            ui.html(cfg['subtitle_html'], sanitize=False)
+
+@lru_cache(maxsize=None)
+def _field_label(text):
+    """Label markup shown above a profile field"""
+    return f'<label class="block text-sm font-semibold text-gray-700 mb-2">{text}</label>'
+
+def _card_header_html(icon, title, subtitle, subtitle_classes):
+    """Static card header (icon, title, subtitle) as a single html element"""
+    return (f'<div class="flex items-center gap-4"><div class="text-3xl">{icon}</div>'
+            f'<div class="flex flex-col gap-4"><h3 class="text-xl font-bold">{title}</h3>'
+            f'<p class="{subtitle_classes}">{subtitle}</p></div></div>')
+
+def _labeled_input(label, value, accent='blue', props='outlined dense', textarea=False):
+    """A profile field: its label and an input (or textarea) in one group container"""
+    with ui.element('div').classes('group'):
+        ui.html(_field_label(label), sanitize=False)
+        if textarea:
+            return ui.textarea(value=value).classes(_INPUT_CLASSES[accent]).classes('min-h-24').props(props)
+        return ui.input(value=value).classes(_INPUT_CLASSES[accent]).props(props)
+
+def create_modern_basic_info_card(data):
     """Create modern basic information card with professional styling"""
-    data = data_manager.get_institution_data()["basic_info"]
-
-    with ui.element('div').classes('bg-white rounded-2xl shadow-xl border border-gray-100 overflow-hidden hover:shadow-2xl transition-all duration-300'):
+    with ui.element('div').classes(_CARD_SHELL):
         # Card Header
-        with ui.element('div').classes('bg-gradient-to-r from-blue-600 to-indigo-600 p-6 text-white'):
-            with ui.row().classes('items-center gap-4'):
-                ui.html('<div class="text-3xl">🏢</div>', sanitize=False)
-                with ui.column():
-                    ui.html('<h3 class="text-xl font-bold">Basic Information</h3>', sanitize=False)
-                    ui.html('<p class="text-blue-100 text-sm">Core company details and registration</p>', sanitize=False)
+        ui.html(_card_header_html('🏢', 'Basic Information', 'Core company details and registration', 'text-blue-100 text-sm'), sanitize=False).classes('bg-gradient-to-r from-blue-600 to-indigo-600 p-6 text-white')
 
         # Card Content
         with ui.element('div').classes('p-6'):
@@ -236,94 +459,71 @@ def create_modern_basic_info_card():
                 # Left Column
                 with ui.element('div').classes('space-y-4'):
                     # Institution Name
-                    with ui.element('div').classes('group'):
-                        ui.html('<label class="block text-sm font-semibold text-gray-700 mb-2">Institution Name</label>', sanitize=False)
-                        ui.input(value=data["name"]).classes('w-full px-4 py-3 border border-gray-300 rounded-xl focus:ring-2 focus:ring-blue-500 focus:border-transparent transition-all duration-200 hover:border-blue-400').props('outlined dense')
+                    _labeled_input('Institution Name', data["name"])
 
                     # Legal Name
-                    with ui.element('div').classes('group'):
-                        ui.html('<label class="block text-sm font-semibold text-gray-700 mb-2">Legal Name</label>', sanitize=False)
-                        ui.input(value=data["legal_name"]).classes('w-full px-4 py-3 border border-gray-300 rounded-xl focus:ring-2 focus:ring-blue-500 focus:border-transparent transition-all duration-200 hover:border-blue-400').props('outlined dense')
+                    _labeled_input('Legal Name', data["legal_name"])
 
                     # Registration Number
-                    with ui.element('div').classes('group'):
-                        ui.html('<label class="block text-sm font-semibold text-gray-700 mb-2">Registration Number</label>', sanitize=False)
-                        ui.input(value=data["registration_number"]).classes('w-full px-4 py-3 border border-gray-300 rounded-xl focus:ring-2 focus:ring-blue-500 focus:border-transparent transition-all duration-200 hover:border-blue-400').props('outlined dense')
+                    _labeled_input('Registration Number', data["registration_number"])
 
                 # Right Column
                 with ui.element('div').classes('space-y-4'):
                     # Founded Date
                     with ui.element('div').classes('group'):
-                        ui.html('<label class="block text-sm font-semibold text-gray-700 mb-2">Founded Date</label>', sanitize=False)
-                        with ui.input().classes('w-full px-4 py-3 border border-gray-300 rounded-xl focus:ring-2 focus:ring-blue-500 focus:border-transparent transition-all duration-200 hover:border-blue-400').props('outlined dense'):
+                        ui.html(_field_label('Founded Date'), sanitize=False)
+                        with ui.input().classes(_INPUT_BLUE).props('outlined dense'):
                             ui.date(value=data["founded_date"])
 
                     # Industry
                     with ui.element('div').classes('group'):
-                        ui.html('<label class="block text-sm font-semibold text-gray-700 mb-2">Industry</label>', sanitize=False)
-                        ui.select(['Technology Services', 'Healthcare', 'Finance', 'Education', 'Manufacturing', 'Retail', 'Consulting'],
-                                 value=data["industry"]).classes('w-full px-4 py-3 border border-gray-300 rounded-xl focus:ring-2 focus:ring-blue-500 focus:border-transparent transition-all duration-200 hover:border-blue-400').props('outlined dense')
+                        ui.html(_field_label('Industry'), sanitize=False)
+                        ui.select(list(_INDUSTRIES),
+                                 value=data["industry"]).classes(_INPUT_BLUE).props('outlined dense')
 
                     # Company Size & Status Row
                     with ui.element('div').classes('grid grid-cols-2 gap-4'):
                         with ui.element('div').classes('group'):
-                            ui.html('<label class="block text-sm font-semibold text-gray-700 mb-2">Company Size</label>', sanitize=False)
-                            ui.select(['1-10', '11-50', '51-200', '201-500', '500+'],
-                                     value=data["company_size"]).classes('w-full px-4 py-3 border border-gray-300 rounded-xl focus:ring-2 focus:ring-blue-500 focus:border-transparent transition-all duration-200 hover:border-blue-400').props('outlined dense')
+                            ui.html(_field_label('Company Size'), sanitize=False)
+                            ui.select(list(_COMPANY_SIZES),
+                                     value=data["company_size"]).classes(_INPUT_BLUE).props('outlined dense')
 
                         with ui.element('div').classes('group'):
-                            ui.html('<label class="block text-sm font-semibold text-gray-700 mb-2">Status</label>', sanitize=False)
-                            ui.select(['Active', 'Inactive', 'Suspended'],
-                                     value=data["status"]).classes('w-full px-4 py-3 border border-gray-300 rounded-xl focus:ring-2 focus:ring-blue-500 focus:border-transparent transition-all duration-200 hover:border-blue-400').props('outlined dense')
+                            ui.html(_field_label('Status'), sanitize=False)
+                            ui.select(list(_STATUSES),
+                                     value=data["status"]).classes(_INPUT_BLUE).props('outlined dense')
 
             # Action Buttons
-            with ui.element('div').classes('flex justify-end gap-3 mt-6 pt-6 border-t border-gray-100'):
+            with ui.element('div').classes(_ACTION_BAR):
                 ui.button('Save Changes', icon='save', on_click=save_institution_changes).classes('bg-blue-600 text-white px-6 py-3 rounded-xl hover:bg-blue-700 font-semibold shadow-lg hover:shadow-xl transition-all duration-300')
-                ui.button('Reset', icon='refresh').classes('bg-gray-100 text-gray-700 px-6 py-3 rounded-xl hover:bg-gray-200 font-semibold transition-all duration-300')
+                ui.button('Reset', icon='refresh').classes(_BTN_GHOST)
 
-def create_modern_contact_card():
+def create_modern_contact_card(data):
     """Create modern contact information card with professional styling"""
-    data = data_manager.get_institution_data()["contact_info"]
-
-    with ui.element('div').classes('bg-white rounded-2xl shadow-xl border border-gray-100 overflow-hidden hover:shadow-2xl transition-all duration-300'):
+    with ui.element('div').classes(_CARD_SHELL):
         # Card Header
-        with ui.element('div').classes('bg-gradient-to-r from-emerald-600 to-green-600 p-6 text-white'):
-            with ui.row().classes('items-center gap-4'):
-                ui.html('<div class="text-3xl">📞</div>', sanitize=False)
-                with ui.column():
-                    ui.html('<h3 class="text-xl font-bold">Contact Information</h3>', sanitize=False)
-                    ui.html('<p class="text-emerald-100 text-sm">Communication details and location</p>', sanitize=False)
+        ui.html(_card_header_html('📞', 'Contact Information', 'Communication details and location', 'text-emerald-100 text-sm'), sanitize=False).classes('bg-gradient-to-r from-emerald-600 to-green-600 p-6 text-white')
 
         # Card Content
         with ui.element('div').classes('p-6 space-y-6'):
 
             # Headquarters Address
-            with ui.element('div').classes('group'):
-                ui.html('<label class="block text-sm font-semibold text-gray-700 mb-2">Headquarters Address</label>', sanitize=False)
-                ui.textarea(value=data["headquarters"]).classes('w-full px-4 py-3 border border-gray-300 rounded-xl focus:ring-2 focus:ring-emerald-500 focus:border-transparent transition-all duration-200 hover:border-emerald-400 min-h-24').props('outlined dense rows=3')
+            _labeled_input('Headquarters Address', data["headquarters"], accent='emerald', props='outlined dense rows=3', textarea=True)
 
             # Contact Details Grid
             with ui.element('div').classes('grid grid-cols-1 md:grid-cols-2 gap-6'):
 
                 # Phone & Fax
                 with ui.element('div').classes('space-y-4'):
-                    with ui.element('div').classes('group'):
-                        ui.html('<label class="block text-sm font-semibold text-gray-700 mb-2">Phone Number</label>', sanitize=False)
-                        ui.input(value=data["phone"]).classes('w-full px-4 py-3 border border-gray-300 rounded-xl focus:ring-2 focus:ring-emerald-500 focus:border-transparent transition-all duration-200 hover:border-emerald-400').props('outlined dense type=tel')
+                    _labeled_input('Phone Number', data["phone"], accent='emerald', props='outlined dense type=tel')
 
-                    with ui.element('div').classes('group'):
-                        ui.html('<label class="block text-sm font-semibold text-gray-700 mb-2">Fax Number</label>', sanitize=False)
-                        ui.input(value=data["fax"]).classes('w-full px-4 py-3 border border-gray-300 rounded-xl focus:ring-2 focus:ring-emerald-500 focus:border-transparent transition-all duration-200 hover:border-emerald-400').props('outlined dense type=tel')
+                    _labeled_input('Fax Number', data["fax"], accent='emerald', props='outlined dense type=tel')
 
                 # Email & Website
                 with ui.element('div').classes('space-y-4'):
-                    with ui.element('div').classes('group'):
-                        ui.html('<label class="block text-sm font-semibold text-gray-700 mb-2">Email Address</label>', sanitize=False)
-                        ui.input(value=data["email"]).classes('w-full px-4 py-3 border border-gray-300 rounded-xl focus:ring-2 focus:ring-emerald-500 focus:border-transparent transition-all duration-200 hover:border-emerald-400').props('outlined dense type=email')
+                    _labeled_input('Email Address', data["email"], accent='emerald', props='outlined dense type=email')
 
-                    with ui.element('div').classes('group'):
-                        ui.html('<label class="block text-sm font-semibold text-gray-700 mb-2">Website</label>', sanitize=False)
-                        ui.input(value=data["website"]).classes('w-full px-4 py-3 border border-gray-300 rounded-xl focus:ring-2 focus:ring-emerald-500 focus:border-transparent transition-all duration-200 hover:border-emerald-400').props('outlined dense type=url')
+                    _labeled_input('Website', data["website"], accent='emerald', props='outlined dense type=url')
 
             # Quick Contact Actions
             with ui.element('div').classes('flex flex-wrap gap-3 mt-6 pt-6 border-t border-gray-100'):
@@ -332,18 +532,11 @@ def create_modern_contact_card():
                 ui.button('🌐 Visit Website', icon='language').classes('bg-purple-600 text-white px-4 py-2 rounded-lg hover:bg-purple-700 font-medium transition-all duration-300')
                 ui.button('📍 View Map', icon='map').classes('bg-orange-600 text-white px-4 py-2 rounded-lg hover:bg-orange-700 font-medium transition-all duration-300')
 
-def create_modern_business_settings_card():
+def create_modern_business_settings_card(data):
     """Create modern business settings card with professional styling"""
-    data = data_manager.get_institution_data()["business_info"]
-
-    with ui.element('div').classes('bg-white rounded-2xl shadow-xl border border-gray-100 overflow-hidden hover:shadow-2xl transition-all duration-300'):
+    with ui.element('div').classes(_CARD_SHELL):
         # Card Header
-        with ui.element('div').classes('bg-gradient-to-r from-purple-600 to-indigo-600 p-6 text-white'):
-            with ui.row().classes('items-center gap-4'):
-                ui.html('<div class="text-3xl">⚙️</div>', sanitize=False)
-                with ui.column():
-                    ui.html('<h3 class="text-xl font-bold">Business Settings</h3>', sanitize=False)
-                    ui.html('<p class="text-purple-100 text-sm">Operational configuration</p>', sanitize=False)
+        ui.html(_card_header_html('⚙️', 'Business Settings', 'Operational configuration', 'text-purple-100 text-sm'), sanitize=False).classes('bg-gradient-to-r from-purple-600 to-indigo-600 p-6 text-white')
 
         # Card Content
         with ui.element('div').classes('p-6 space-y-6'):
@@ -354,68 +547,55 @@ def create_modern_business_settings_card():
                 # Fiscal Year & Currency
                 with ui.element('div').classes('grid grid-cols-2 gap-4'):
                     with ui.element('div').classes('group'):
-                        ui.html('<label class="block text-sm font-semibold text-gray-700 mb-2">Fiscal Year Start</label>', sanitize=False)
-                        ui.select(['January', 'February', 'March', 'April', 'May', 'June',
-                                  'July', 'August', 'September', 'October', 'November', 'December'],
-                                 value=data["fiscal_year_start"]).classes('w-full px-4 py-3 border border-gray-300 rounded-xl focus:ring-2 focus:ring-purple-500 focus:border-transparent transition-all duration-200 hover:border-purple-400').props('outlined dense')
+                        ui.html(_field_label('Fiscal Year Start'), sanitize=False)
+                        ui.select(list(_MONTHS),
+                                 value=data["fiscal_year_start"]).classes(_INPUT_PURPLE).props('outlined dense')
 
                     with ui.element('div').classes('group'):
-                        ui.html('<label class="block text-sm font-semibold text-gray-700 mb-2">Currency</label>', sanitize=False)
-                        ui.select(['USD', 'EUR', 'GBP', 'JPY', 'CAD', 'AUD'],
-                                 value=data["currency"]).classes('w-full px-4 py-3 border border-gray-300 rounded-xl focus:ring-2 focus:ring-purple-500 focus:border-transparent transition-all duration-200 hover:border-purple-400').props('outlined dense')
+                        ui.html(_field_label('Currency'), sanitize=False)
+                        ui.select(list(_CURRENCIES),
+                                 value=data["currency"]).classes(_INPUT_PURPLE).props('outlined dense')
 
                 # Timezone & Business Hours
                 with ui.element('div').classes('grid grid-cols-2 gap-4'):
                     with ui.element('div').classes('group'):
-                        ui.html('<label class="block text-sm font-semibold text-gray-700 mb-2">Timezone</label>', sanitize=False)
-                        ui.select(['America/New_York', 'America/Los_Angeles', 'Europe/London', 'Europe/Berlin', 'Asia/Tokyo', 'Asia/Shanghai', 'Australia/Sydney'],
-                                 value=data["timezone"]).classes('w-full px-4 py-3 border border-gray-300 rounded-xl focus:ring-2 focus:ring-purple-500 focus:border-transparent transition-all duration-200 hover:border-purple-400').props('outlined dense')
+                        ui.html(_field_label('Timezone'), sanitize=False)
+                        ui.select(list(_TIMEZONES),
+                                 value=data["timezone"]).classes(_INPUT_PURPLE).props('outlined dense')
 
-                    with ui.element('div').classes('group'):
-                        ui.html('<label class="block text-sm font-semibold text-gray-700 mb-2">Business Hours</label>', sanitize=False)
-                        ui.input(value=data["business_hours"]).classes('w-full px-4 py-3 border border-gray-300 rounded-xl focus:ring-2 focus:ring-purple-500 focus:border-transparent transition-all duration-200 hover:border-purple-400').props('outlined dense')
+                    _labeled_input('Business Hours', data["business_hours"], accent='purple')
 
             # Working Days Section
             with ui.element('div').classes('group'):
                 ui.html('<label class="block text-sm font-semibold text-gray-700 mb-4">Working Days</label>', sanitize=False)
                 with ui.element('div').classes('grid grid-cols-2 md:grid-cols-4 gap-3'):
-                    days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-                    for day in days:
-                        is_checked = day in data["working_days"]
-                        with ui.element('div').classes(f'flex items-center p-3 rounded-xl border-2 transition-all duration-200 cursor-pointer hover:shadow-md {"border-purple-500 bg-purple-50" if is_checked else "border-gray-200 hover:border-purple-300"}'):
+                    working_mask = working_days_mask(data["working_days"])
+                    for weekday, day in enumerate(_DAYS):
+                        is_checked = is_working_day(working_mask, weekday)
+                        with ui.element('div').classes(_DAY_TILE_CLS[is_checked]):
                             ui.checkbox(day, value=is_checked).classes('mr-3')
-                            ui.html(f'<span class="text-sm font-medium {"text-purple-700" if is_checked else "text-gray-600"}">{day[:3]}</span>', sanitize=False)
+                            ui.html(_DAY_LABEL_HTML[day, is_checked], sanitize=False)
 
             # Business Rules Section
             with ui.element('div').classes('bg-gray-50 rounded-xl p-4 border border-gray-200'):
                 ui.html('<h4 class="text-lg font-semibold text-gray-800 mb-3">Business Rules</h4>', sanitize=False)
                 with ui.element('div').classes('space-y-3'):
-                    rules = [
-                        {'label': 'Overtime Policy', 'value': '1.5x after 40 hours'},
-                        {'label': 'Leave Accrual', 'value': '10 days per year'},
-                        {'label': 'Remote Work', 'value': 'Hybrid model allowed'}
-                    ]
-                    for rule in rules:
+                    for rule_label, rule_value in _BUSINESS_RULES:
                         with ui.element('div').classes('flex justify-between items-center py-2 border-b border-gray-100 last:border-b-0'):
-                            ui.html(f'<span class="text-sm font-medium text-gray-700">{rule["label"]}</span>', sanitize=False)
-                            ui.html(f'<span class="text-sm text-gray-600">{rule["value"]}</span>', sanitize=False)
+                            ui.html(f'<span class="text-sm font-medium text-gray-700">{rule_label}</span>', sanitize=False)
+                            ui.html(f'<span class="text-sm text-gray-600">{rule_value}</span>', sanitize=False)
 
             # Action Buttons
-            with ui.element('div').classes('flex justify-end gap-3 mt-6 pt-6 border-t border-gray-100'):
+            with ui.element('div').classes(_ACTION_BAR):
                 ui.button('Update Settings', icon='settings', on_click=save_institution_changes).classes('bg-purple-600 text-white px-6 py-3 rounded-xl hover:bg-purple-700 font-semibold shadow-lg hover:shadow-xl transition-all duration-300')
-                ui.button('Reset to Default', icon='refresh').classes('bg-gray-100 text-gray-700 px-6 py-3 rounded-xl hover:bg-gray-200 font-semibold transition-all duration-300')
+                ui.button('Reset to Default', icon='refresh').classes(_BTN_GHOST)
 
 def create_modern_integration_card():
     """Create modern system integration card with professional styling"""
 
-    with ui.element('div').classes('bg-white rounded-2xl shadow-xl border border-gray-100 overflow-hidden hover:shadow-2xl transition-all duration-300'):
+    with ui.element('div').classes(_CARD_SHELL):
         # Card Header
-        with ui.element('div').classes('bg-gradient-to-r from-orange-600 to-red-600 p-6 text-white'):
-            with ui.row().classes('items-center gap-4'):
-                ui.html('<div class="text-3xl">🔗</div>', sanitize=False)
-                with ui.column():
-                    ui.html('<h3 class="text-xl font-bold">System Integration</h3>', sanitize=False)
-                    ui.html('<p class="text-orange-100 text-sm">Connected HR modules</p>', sanitize=False)
+        ui.html(_card_header_html('🔗', 'System Integration', 'Connected HR modules', 'text-orange-100 text-sm'), sanitize=False).classes('bg-gradient-to-r from-orange-600 to-red-600 p-6 text-white')
 
         # Card Content
         with ui.element('div').classes('p-6'):
@@ -423,47 +603,22 @@ def create_modern_integration_card():
             # Connected Modules
             ui.html('<h4 class="text-lg font-semibold text-gray-800 mb-4">HR Module Connections</h4>', sanitize=False)
 
-            modules = [
-                {'name': 'Employee Management', 'status': 'Connected', 'icon': '👥', 'color': 'emerald', 'description': 'Staff directory & profiles'},
-                {'name': 'Department Management', 'status': 'Connected', 'icon': '🏢', 'color': 'emerald', 'description': 'Organizational structure'},
-                {'name': 'Attendance Tracking', 'status': 'Connected', 'icon': '⏰', 'color': 'emerald', 'description': 'Time & attendance'},
-                {'name': 'Payroll System', 'status': 'Pending', 'icon': '💰', 'color': 'orange', 'description': 'Salary & compensation'},
-                {'name': 'Performance Reviews', 'status': 'Not Connected', 'icon': '⭐', 'color': 'red', 'description': 'Employee evaluations'},
-                {'name': 'Recruitment', 'status': 'Not Connected', 'icon': '🎯', 'color': 'red', 'description': 'Hiring & onboarding'}
-            ]
-
             with ui.element('div').classes('space-y-3 mb-6'):
-                for module in modules:
-                    status_class = f"border-{module['color']}-200 bg-{module['color']}-50" if module["status"] == "Connected" else "border-gray-200"
-                    with ui.element('div').classes(f'flex items-center justify-between p-4 rounded-xl border-2 transition-all duration-200 hover:shadow-md {status_class}'):
-                        with ui.row().classes('items-center gap-4 flex-1'):
-                            ui.html(f'<div class="text-2xl">{module["icon"]}</div>', sanitize=False)
-                            with ui.column().classes('flex-1'):
-                                ui.html(f'<div class="font-semibold text-gray-800">{module["name"]}</div>', sanitize=False)
-                                ui.html(f'<div class="text-sm text-gray-600">{module["description"]}</div>', sanitize=False)
-
-                        with ui.element('div').classes('text-right'):
-                            if module["status"] == "Connected":
-                                ui.html(f'<div class="inline-flex items-center px-3 py-1 rounded-full text-xs font-medium bg-{module["color"]}-100 text-{module["color"]}-800"><div class="w-2 h-2 bg-{module["color"]}-500 rounded-full mr-2"></div>Connected</div>', sanitize=False)
-                            elif module["status"] == "Pending":
-                                ui.html('<div class="inline-flex items-center px-3 py-1 rounded-full text-xs font-medium bg-orange-100 text-orange-800"><div class="w-2 h-2 bg-orange-500 rounded-full mr-2 animate-pulse"></div>Pending</div>', sanitize=False)
-                            else:
-                                ui.button('Connect', on_click=lambda m=module: connect_module(m)).classes(f'bg-{module["color"]}-600 text-white px-4 py-2 rounded-lg hover:bg-{module["color"]}-700 text-sm font-medium transition-all duration-300')
+                for block in _HR_MODULE_BLOCKS:
+                    if isinstance(block, str):
+                        ui.html(block, sanitize=False)
+                        continue
+                    # Modules that are not connected yet still need a live Connect button
+                    with ui.element('div').classes(f'{_MODULE_ROW_CLS} border-gray-200'):
+                        ui.html(_module_info_html(block), sanitize=False).classes('flex-1')
+                        ui.button('Connect', on_click=lambda m=block: connect_module(m)).classes(_CONNECT_BTN_CLS[block.color])
 
             # Quick Actions
             ui.html('<h4 class="text-lg font-semibold text-gray-800 mb-4">Quick Actions</h4>', sanitize=False)
 
             with ui.element('div').classes('grid grid-cols-1 gap-3'):
-                actions = [
-                    {'name': 'Create Department', 'icon': '🏗️', 'route': '/administration/departments', 'color': 'blue'},
-                    {'name': 'Add Employee', 'icon': '👤', 'route': '/administration/enroll-staff', 'color': 'green'},
-                    {'name': 'View Reports', 'icon': '📊', 'route': '/reports/dashboard', 'color': 'purple'},
-                    {'name': 'System Settings', 'icon': '⚙️', 'route': '/administration/settings', 'color': 'gray'}
-                ]
-
-                for action in actions:
-                    ui.button(f'{action["icon"]} {action["name"]}',
-                             on_click=lambda r=action['route']: navigate_to_module(r)).classes(f'w-full bg-{action["color"]}-600 text-white p-4 rounded-xl hover:bg-{action["color"]}-700 font-semibold shadow-lg hover:shadow-xl transition-all duration-300 text-left').props('no-caps')
+                for label, route, classes in _QUICK_ACTIONS:
+                    ui.button(label, on_click=lambda r=route: navigate_to_module(r)).classes(classes).props('no-caps')
 
             # System Health
             with ui.element('div').classes('mt-6 p-4 bg-gradient-to-r from-green-50 to-emerald-50 rounded-xl border border-green-200'):
@@ -478,32 +633,36 @@ def create_modern_integration_card():
 
 def connect_module(module):
     """Handle module connection logic"""
-    ui.notify(f'Connecting to {module["name"]}...', color='info')
+    ui.notify(f'Connecting to {module.name}...', color='info')
     # In a real application, this would initiate the connection process
-    print(f"Connecting to module: {module['name']}")
+    print(f"Connecting to module: {module.name}")
 
 # Utility functions for data operations
 async def export_institution_data():
     """Export institution data algorithm"""
-    data = data_manager.get_institution_data()
+    data = get_data_manager().get_institution_data()
     ui.notify('Exporting institution data...', color='info')
     
     # Simulate export process
-    await asyncio.sleep(1)
+    if DEMO_MODE:
+        await asyncio.sleep(1)
     
     # In a real application, this would generate and download a file
     ui.notify('Institution data exported successfully!', color='positive')
-    print(f"Exported data: {json.dumps(data, indent=2)}")
+    # Only serialize the export for the debug log when someone is reading it
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Exported data: %s", orjson.dumps(data, default=dict, option=orjson.OPT_INDENT_2).decode())
 
 async def save_institution_changes():
     """Save institution changes with validation"""
     ui.notify('Saving changes...', color='info')
     
     # Simulate save process with validation
-    await asyncio.sleep(1)
+    if DEMO_MODE:
+        await asyncio.sleep(1)
     
     # Update last modified timestamp
-    data_manager.institution_data["statistics"]["last_updated"] = datetime.now().isoformat()
+    get_data_manager().mark_updated()
     
     ui.notify('Changes saved successfully!', color='positive')
 
@@ -519,11 +678,11 @@ def get_institution_integration_data():
     API for other modules to get institution data
     This function can be imported and used by other HR modules
     """
-    return data_manager.get_institution_data()
+    return get_data_manager().get_institution_data()
 
 def update_institution_statistics(stats_update):
     """
     API for other modules to update institution statistics
     This allows modules like Employee Management to update employee count
     """
-    return data_manager.update_section("statistics", stats_update)
\ No newline at end of file
+    return get_data_manager().update_section("statistics", stats_update)
\ No newline at end of file
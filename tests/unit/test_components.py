@@ -5,12 +5,16 @@ import pytest
 from unittest.mock import Mock, patch
 import sys
 import os
+from datetime import date
 
 # Add the project root to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
 
 from components.attendance.attendance_rules import create_overtime_rules_panel, AttendanceRulesManager
 from components.attendance.shift_timetable import TemplateState
+from components.administration.employee_termination import TerminationManager
+from components.administration.enroll_staff import EmployeeDataManager
+from components.administration.institution_profile import InstitutionDataManager, is_working_day, get_data_manager
 
 
 class TestAttendanceRules:
@@ -58,6 +62,130 @@ class TestAttendanceRules:
         assert state.selected_template == "morning_shift"
 
 
+class TestTerminationManager:
+    """Test cases for termination record management"""
+
+    def test_purge_expired_records(self):
+        """Test that records older than the retention period are dropped"""
+        manager = TerminationManager()
+
+        assert manager.purge_expired_records(today=date(2025, 1, 1)) == 0
+        assert manager.purge_expired_records(today=date(2031, 12, 1)) == 2
+        assert manager.get_termination_records() == []
+        assert manager.get_termination_records_for_period("2024-09-01", "2024-09-30") == []
+
+    def test_validation_results_are_cached(self):
+        """Test that repeated validation of the same request hits the cache"""
+        manager = TerminationManager()
+        request = {
+            "employee_id": "EMP-003",
+            "termination_type": "Redundancy",
+            "initiation_date": "2024-01-01",
+            "effective_date": "2024-01-15"
+        }
+
+        first = manager.validate_termination_request(request)
+        first["errors"].append("mutated by caller")
+        second = manager.validate_termination_request(request)
+
+        assert second["errors"] == ["Insufficient notice period: 14 days provided, 60 days required"]
+        assert manager._validate_cached.cache_info().hits == 1
+
+    def test_compute_security_metrics(self):
+        """Test the analytics aggregates over the seeded records"""
+        metrics = TerminationManager().compute_security_metrics()
+
+        assert metrics.avg_security_score == 96
+        assert metrics.compliance_rate == 100
+        assert metrics.audit_findings == 0
+        assert metrics.documentation_gaps == 1
+
+
+class TestEmployeeDataManager:
+    """Test cases for employee enrollment data management"""
+
+    def _enroll(self, manager, first_name, last_name, department, position):
+        success, profile = manager.create_employee_profile({
+            "first_name": first_name,
+            "last_name": last_name,
+            "email": f"{first_name.lower()}.{last_name.lower()}@company.com",
+            "phone": "+15551234567",
+            "department": department,
+            "position": position,
+            "employment_type": "Full-time",
+            "start_date": "2099-01-01"
+        })
+        assert success, profile
+        return profile.employee_id
+
+    def test_search_employees(self):
+        """Test word, substring and multi-word employee search"""
+        manager = EmployeeDataManager()
+        john = self._enroll(manager, "John", "Doe", "Finance", "Accountant")
+        jane = self._enroll(manager, "Jane", "Johnson", "Legal", "Legal Counsel")
+
+        def ids(query):
+            return [employee.employee_id for employee in manager.search_employees(query)]
+
+        assert ids("JOHN") == [john, jane]
+        assert ids("ohns") == [jane]
+        assert ids("john doe") == [john]
+        assert ids("@company.com") == [john, jane]
+        assert ids("missing") == []
+
+    def test_institution_count_excludes_terminated_employees(self):
+        """Test that the institution employee count tracks active employees only"""
+        manager = EmployeeDataManager()
+        john = self._enroll(manager, "John", "Doe", "Finance", "Accountant")
+        self._enroll(manager, "Jane", "Johnson", "Legal", "Legal Counsel")
+        manager.set_employee_status(john, "Terminated")
+        self._enroll(manager, "Mary", "Major", "Finance", "Accountant")
+
+        assert get_data_manager().institution_data["statistics"]["total_employees"] == 2
+
+    def test_validation_reports_missing_fields_first(self):
+        """Test that format checks are skipped until all required fields are filled in"""
+        manager = EmployeeDataManager()
+        data = {"first_name": "John", "email": "not-an-email", "phone": "123"}
+
+        assert manager.validate_employee_data(data) == [
+            "Last Name is required",
+            "Department is required",
+            "Position is required",
+            "Start Date is required"
+        ]
+
+        data.update(last_name="Doe", department="Finance", position="Accountant", start_date="2099-01-01")
+        assert manager.validate_employee_data(data) == ["Invalid email format", "Invalid phone number format"]
+
+
+class TestInstitutionDataManager:
+    """Test cases for institution profile data management"""
+
+    def test_working_days_mask(self):
+        """Test that the working-days bitmask follows date.weekday() numbering"""
+        mask = InstitutionDataManager().get_working_days_mask()
+
+        assert mask == 0b0011111
+        assert [is_working_day(mask, day.weekday()) for day in (date(2024, 1, 1), date(2024, 1, 5), date(2024, 1, 6))] == [True, True, False]
+
+    def test_seeded_sections_pass_validation(self):
+        """Test that saving the seeded institution data back unchanged is accepted"""
+        manager = InstitutionDataManager()
+
+        for section in ("basic_info", "contact_info", "business_info"):
+            assert manager.update_section(section, dict(manager.institution_data[section])) == (True, "Data updated successfully")
+
+    def test_malformed_contact_details_are_rejected(self):
+        """Test that the email and phone patterns are enforced"""
+        manager = InstitutionDataManager()
+
+        assert manager.update_section("contact_info", {"email": "not-an-email"}) == (False, "Validation failed")
+        assert manager.update_section("contact_info", {"phone": "abc"}) == (False, "Validation failed")
+        assert manager.update_section("contact_info", {"phone": "+1 (555) 12"}) == (False, "Validation failed")
+        assert manager.update_section("contact_info", {"phone": "555-123-4567"}) == (True, "Data updated successfully")
+
+
 class TestHelperFunctions:
     """Test cases for helper functions"""
 